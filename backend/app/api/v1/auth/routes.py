@@ -32,6 +32,12 @@ from backend.app.config import config
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+# Fields of UpdateHITLConfigRequest that are merged into user.hitl_config when set
+_HITL_CONFIG_FIELDS = tuple(UpdateHITLConfigRequest.model_fields)
+
+# Fields of UpdateProfileRequest that are copied onto the user when set
+_PROFILE_FIELDS = tuple(UpdateProfileRequest.model_fields)
+
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
@@ -202,11 +208,13 @@ async def update_profile(
     """
     Update current user's profile.
     """
-    if request.full_name is not None:
-        current_user.full_name = request.full_name
-    
-    if request.preferences is not None:
-        current_user.preferences = request.preferences
+    updates = {
+        field: value
+        for field in _PROFILE_FIELDS
+        if (value := getattr(request, field)) is not None
+    }
+    for field, value in updates.items():
+        setattr(current_user, field, value)
     
     await db.commit()
     await db.refresh(current_user)
@@ -233,16 +241,13 @@ async def update_hitl_config(
     """
     Update current user's HITL configuration.
     """
-    current_config = current_user.hitl_config or {}
-    
-    if request.enabled is not None:
-        current_config["enabled"] = request.enabled
-    if request.mode is not None:
-        current_config["mode"] = request.mode
-    if request.sensitive_tools is not None:
-        current_config["sensitive_tools"] = request.sensitive_tools
-    if request.approval_message is not None:
-        current_config["approval_message"] = request.approval_message
+    # Create a new dict to force SQLAlchemy change detection on JSONB
+    current_config = dict(current_user.hitl_config or {})
+    current_config.update({
+        field: value
+        for field in _HITL_CONFIG_FIELDS
+        if (value := getattr(request, field)) is not None
+    })
     
     current_user.hitl_config = current_config
     await db.commit()
@@ -5,8 +5,7 @@ Simplified to remove DB-based HITL logic.
 """
 
 import uuid
-import json
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Dict, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -16,6 +15,7 @@ from backend.app.dependencies import get_db, get_current_user
 from backend.app.models.user import User
 from backend.app.models.conversation import Conversation, ConversationStatus
 from backend.app.models.message import Message, MessageRole
+from backend.app.core import jsonutil
 from backend.app.api.v1.chat.schemas import (
     NewChatRequest,
     SendMessageRequest,
@@ -28,6 +28,14 @@ from backend.app.api.v1.chat.schemas import (
 router = APIRouter(prefix="/chat", tags=["Chat"])
 
 
+def _sse_event(event: Dict[str, Any]) -> bytes:
+    """Encode one event as an SSE `data:` frame."""
+    return b"data: " + jsonutil.dumps(event) + b"\n\n"
+
+
+_SSE_DONE = _sse_event({"type": "done"})
+
+
 @router.post("/new", response_model=ChatResponse, status_code=status.HTTP_201_CREATED)
 async def create_new_chat(
     request: NewChatRequest,
@@ -104,7 +112,7 @@ async def send_message(
         conversation.title = request.content[:50] + ("..." if len(request.content) > 50 else "")
         await db.commit()
     
-    async def generate_stream() -> AsyncGenerator[str, None]:
+    async def generate_stream() -> AsyncGenerator[bytes, None]:
         try:
             from backend.app.services.chat_service import ChatService
             chat_service = ChatService(current_user.id, db)
@@ -113,12 +121,12 @@ async def send_message(
                 conversation=conversation,
                 user_input=request.content,
             ):
-                yield f"data: {json.dumps(event)}\n\n"
+                yield _sse_event(event)
             
-            yield f"data: {json.dumps({'type': 'done'})}\n\n"
+            yield _SSE_DONE
             
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'content': str(e)})}\n\n"
+            yield _sse_event({"type": "error", "content": str(e)})
     
     return StreamingResponse(
         generate_stream(),
@@ -153,7 +161,7 @@ async def resume_chat(
     if not conversation:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Conversation not found")
         
-    async def generate_stream() -> AsyncGenerator[str, None]:
+    async def generate_stream() -> AsyncGenerator[bytes, None]:
         try:
             from backend.app.services.chat_service import ChatService
             chat_service = ChatService(current_user.id, db)
@@ -162,12 +170,12 @@ async def resume_chat(
                 conversation=conversation,
                 decisions=request.decisions,
             ):
-                yield f"data: {json.dumps(event)}\n\n"
+                yield _sse_event(event)
             
-            yield f"data: {json.dumps({'type': 'done'})}\n\n"
+            yield _SSE_DONE
             
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'content': str(e)})}\n\n"
+            yield _sse_event({"type": "error", "content": str(e)})
             
     return StreamingResponse(
         generate_stream(),
@@ -3,8 +3,8 @@ Pydantic schemas for chat endpoints.
 Updated for simplified HITL flow.
 """
 
-from typing import Optional, List, Any, Dict
-from pydantic import BaseModel, Field
+from typing import Optional, List, Any, Dict, Literal, Required, TypedDict
+from pydantic import BaseModel, ConfigDict, Field, with_config
 from uuid import UUID
 from datetime import datetime
 from enum import Enum
@@ -21,6 +21,18 @@ class StreamEventType(str, Enum):
     DONE = "done"
 
 
+# Decision types accepted by the HumanInTheLoopMiddleware
+DecisionType = Literal["approve", "reject", "edit"]
+
+
+@with_config(ConfigDict(extra="allow"))
+class HITLDecision(TypedDict, total=False):
+    """A single HITL decision; validated by pydantic-core but kept as a plain dict."""
+    type: Required[DecisionType]
+    edited_action: Dict[str, Any]
+    message: str
+
+
 # ============================================
 # Request Schemas
 # ============================================
@@ -38,7 +50,7 @@ class SendMessageRequest(BaseModel):
 
 class ResumeRequest(BaseModel):
     """Request body for resuming chat after HITL approval."""
-    decisions: List[Dict[str, Any]]
+    decisions: List[HITLDecision]
     # Example: [{"type": "approve"}] 
     # or [{"type": "edit", "edited_action": {"name": "...", "args": {...}}}]
 
@@ -25,6 +25,9 @@ from backend.app.api.v1.auth.schemas import MessageResponse
 
 router = APIRouter(prefix="/conversations", tags=["Conversations"])
 
+# Characters of the last message shown in the conversation list
+PREVIEW_LENGTH = 100
+
 
 @router.get("/", response_model=ConversationListResponse)
 async def list_conversations(
@@ -39,59 +42,81 @@ async def list_conversations(
     """
     List user's conversations with pagination.
     """
-    # Base query
-    query = select(Conversation).where(Conversation.user_id == current_user.id)
+    # Filters (shared by the page query and, if needed, the count query)
+    conditions = [Conversation.user_id == current_user.id]
     
-    # Apply filters
     if not include_deleted:
-        query = query.where(Conversation.is_deleted == False)
+        conditions.append(Conversation.is_deleted == False)
     
     if status_filter:
-        query = query.where(Conversation.status == status_filter)
+        conditions.append(Conversation.status == status_filter)
     
     if search:
-        query = query.where(Conversation.title.ilike(f"%{search}%"))
-    
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+        conditions.append(Conversation.title.ilike(f"%{search}%"))
     
     # Apply pagination
-    query = query.order_by(Conversation.updated_at.desc())
-    query = query.offset((page - 1) * page_size).limit(page_size)
+    offset = (page - 1) * page_size
+    query = (
+        select(Conversation)
+        .where(*conditions)
+        .order_by(Conversation.updated_at.desc())
+        .offset(offset)
+        .limit(page_size)
+    )
     
     result = await db.execute(query)
     conversations = result.scalars().all()
     
-    # Build response with message counts
-    items = []
-    for conv in conversations:
-        # Get message count
-        msg_count_result = await db.execute(
-            select(func.count()).where(Message.conversation_id == conv.id)
+    # A short page is the last one, so the total is already known; only
+    # full (or out-of-range) pages need a separate count
+    if len(conversations) < page_size and (conversations or page == 1):
+        total = offset + len(conversations)
+    else:
+        count_query = select(func.count()).select_from(Conversation).where(*conditions)
+        total = (await db.execute(count_query)).scalar() or 0
+    
+    # Fetch message counts and last-message previews for the whole page at once
+    # instead of two queries per conversation. Only the preview prefix of the
+    # last message is selected, so long messages are never loaded in full.
+    conv_ids = [conv.id for conv in conversations]
+    msg_counts = {}
+    previews = {}
+    if conv_ids:
+        count_result = await db.execute(
+            select(Message.conversation_id, func.count())
+            .where(Message.conversation_id.in_(conv_ids))
+            .group_by(Message.conversation_id)
         )
-        msg_count = msg_count_result.scalar() or 0
+        msg_counts = dict(count_result.all())
         
-        # Get last message preview
+        ranked = (
+            select(
+                Message.conversation_id,
+                func.substr(Message.content, 1, PREVIEW_LENGTH + 1).label("head"),
+                func.row_number().over(
+                    partition_by=Message.conversation_id,
+                    order_by=Message.created_at.desc(),
+                ).label("rn"),
+            )
+            .where(Message.conversation_id.in_(conv_ids))
+            .subquery()
+        )
         last_msg_result = await db.execute(
-            select(Message)
-            .where(Message.conversation_id == conv.id)
-            .order_by(Message.created_at.desc())
-            .limit(1)
+            select(ranked.c.conversation_id, ranked.c.head).where(ranked.c.rn == 1)
         )
-        last_msg = last_msg_result.scalar_one_or_none()
-        preview = None
-        if last_msg:
-            preview = last_msg.content[:100] + ("..." if len(last_msg.content) > 100 else "")
-        
+        for conv_id, head in last_msg_result.all():
+            previews[conv_id] = head[:PREVIEW_LENGTH] + ("..." if len(head) > PREVIEW_LENGTH else "")
+    
+    # Build response with message counts
+    items = []
+    for conv in conversations:
         items.append(ConversationListItem(
             id=conv.id,
             thread_id=conv.thread_id,
             title=conv.title,
             status=conv.status,
-            message_count=msg_count,
-            last_message_preview=preview,
+            message_count=msg_counts.get(conv.id, 0),
+            last_message_preview=previews.get(conv.id),
             created_at=conv.created_at,
             updated_at=conv.updated_at,
             is_deleted=conv.is_deleted or False,
@@ -3,9 +3,13 @@ MCP Server management routes.
 Handles adding, removing, enabling/disabling MCP servers.
 """
 
+import asyncio
 import logging
 import os
-from typing import List
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -27,21 +31,35 @@ from backend.app.api.v1.auth.schemas import MessageResponse
 router = APIRouter(prefix="/mcp/servers", tags=["MCP Servers"])
 logger = logging.getLogger(__name__)
 
+# Shared read-only fallback for servers missing from the live status map
+_EMPTY_STATUS: Mapping = MappingProxyType({})
+
+# Env var names whose values are never echoed back (one scan per key)
+_SENSITIVE_ENV_KEY = re.compile("KEY|TOKEN|SECRET|PASSWORD", re.IGNORECASE)
+
 
 def _mask_sensitive_config(config: dict) -> dict:
     """Mask sensitive values in config for response."""
     masked = config.copy()
     if "env" in masked:
-        masked_env = {}
-        for key, value in masked["env"].items():
-            if any(s in key.upper() for s in ["KEY", "TOKEN", "SECRET", "PASSWORD"]):
-                masked_env[key] = "***masked***"
-            else:
-                masked_env[key] = value
-        masked["env"] = masked_env
+        masked["env"] = {
+            key: "***masked***" if _SENSITIVE_ENV_KEY.search(key) else value
+            for key, value in masked["env"].items()
+        }
     return masked
 
 
+@lru_cache(maxsize=1)
+def _registry_icons() -> Dict[str, str]:
+    """Registry icon lookup by app id and name (static, built once)."""
+    from backend.app.core.mcp.registry import SPHERE_REGISTRY
+    registry_icons = {}
+    for app in SPHERE_REGISTRY:
+        registry_icons[app.id] = app.icon
+        registry_icons[app.name] = app.icon
+    return registry_icons
+
+
 @router.get("/", response_model=MCPServerListResponse)
 async def list_servers(
     current_user: User = Depends(get_current_user),
@@ -53,26 +71,22 @@ async def list_servers(
     from backend.app.core.mcp.pool import mcp_pool
     manager = await mcp_pool.get_manager(current_user.id)
     
-    # Get live status from manager (includes connected status and tools)
-    all_status = await manager.get_all_tools_status()
-    
-    # Get icons from registry for matching
-    from backend.app.core.mcp.registry import SPHERE_REGISTRY
-    registry_icons = {}
-    for app in SPHERE_REGISTRY:
-        registry_icons[app.id] = app.icon
-        registry_icons[app.name] = app.icon
-
-    
-    # Also fetch from DB for basic info (id, timestamps)
-    result = await db.execute(
-        select(MCPServerConfig).where(MCPServerConfig.user_id == current_user.id)
+    # Live status from manager (includes connected status and tools) and
+    # DB rows for basic info (id, timestamps) are independent: fetch together
+    all_status, result = await asyncio.gather(
+        manager.get_all_tools_status(),
+        db.execute(
+            select(MCPServerConfig).where(MCPServerConfig.user_id == current_user.id)
+        ),
     )
     db_configs = result.scalars().all()
     
+    # Get icons from registry for matching
+    registry_icons = _registry_icons()
+    
     server_responses = []
     for db_cfg in db_configs:
-        status_info = all_status.get(db_cfg.name, {})
+        status_info = all_status.get(db_cfg.name, _EMPTY_STATUS)
         
         # Prepare a "safe" version of the config for the UI list
         safe_config = {}
@@ -117,8 +131,9 @@ async def add_server(
     """
     Add a new MCP server configuration.
     """
-    logger.info(f"Adding Server Request: Name={request.name}")
-    logger.info(f"Config Payload: {request.config}")
+    logger.info("Adding Server Request: Name=%s", request.name)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Config Payload: %s", _mask_sensitive_config(request.config))
     
     from backend.app.core.mcp.pool import mcp_pool
     manager = await mcp_pool.get_manager(current_user.id)
@@ -155,13 +170,13 @@ async def add_server(
     
     test_client = MCPClient()
     try:
-        logger.info(f"Testing connection for {request.name} with URL: {request.config.get('url')}")
+        logger.info("Testing connection for %s with URL: %s", request.name, request.config.get('url'))
         # Use request.config directly for test
         test_session = await test_client.create_session("temp_test", request.config)
         logger.info("Test connection successful")
         # If we reach here, connection was successful
     except Exception as e:
-        logger.error(f"Failed to validate server {request.name} before adding: {e}", exc_info=True)
+        logger.error("Failed to validate server %s before adding: %s", request.name, e, exc_info=True)
         # Check for hints of 401/Auth
         err_str = str(e)
         if "401" in err_str or "Unauthorized" in err_str:
@@ -186,25 +201,23 @@ async def add_server(
     # Reload local cache
     await manager.initialize()
     
-    # Fetch created to return response format (singular MCPServerResponse)
-    result = await db.execute(
-        select(MCPServerConfig).where(
-            MCPServerConfig.user_id == current_user.id,
-            MCPServerConfig.name == request.name
-        )
+    # Fetch created row (for the MCPServerResponse format) alongside the
+    # live status for the connected field (optional but helpful)
+    result, all_status = await asyncio.gather(
+        db.execute(
+            select(MCPServerConfig).where(
+                MCPServerConfig.user_id == current_user.id,
+                MCPServerConfig.name == request.name
+            )
+        ),
+        manager.get_all_tools_status(),
     )
     server = result.scalar_one_or_none()
     
     if not server:
          raise HTTPException(status_code=500, detail="Server saved but not found")
 
-    # Get live status for connected field (optional but helpful)
-    all_status = await manager.get_all_tools_status()
-    status_info = all_status.get(server.name, {})
-
-    # Use registry icon if available
-    from backend.app.core.mcp.registry import SPHERE_REGISTRY
-    registry_icons = {app.name: app.icon for app in SPHERE_REGISTRY}
+    status_info = all_status.get(server.name, _EMPTY_STATUS)
 
     return MCPServerResponse(
         id=server.id,
@@ -214,7 +227,7 @@ async def add_server(
         config=_mask_sensitive_config(server.config),
         disabled_tools=server.disabled_tools or [],
         tools=status_info.get("tools", []),
-        icon=registry_icons.get(server.name),
+        icon=_registry_icons().get(server.name),  # Use registry icon if available
         created_at=server.created_at,
         updated_at=server.updated_at,
     )
@@ -416,7 +429,7 @@ async def test_server_connection(
         
         # Get live tool status (this will now be populated because we are connected)
         all_status = await manager.get_all_tools_status()
-        status_info = all_status.get(server_name, {})
+        status_info = all_status.get(server_name, _EMPTY_STATUS)
         
         if not status_info.get("connected"):
             # If restart didn't result in connection
@@ -437,7 +450,7 @@ async def test_server_connection(
             tools=tool_names,
         )
     except Exception as e:
-        logger.error(f"Test connection error for {server_name}: {e}", exc_info=True)
+        logger.error("Test connection error for %s: %s", server_name, e, exc_info=True)
         return TestConnectionResponse(
             success=False,
             message=f"Failed to connect to '{server_name}': {str(e)}",
@@ -3,11 +3,21 @@ Pydantic schemas for MCP server management endpoints.
 """
 
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from uuid import UUID
 from datetime import datetime
 
 
+def _validate_server_config(config: Dict[str, Any]) -> None:
+    """Reject configs that name no transport (stdio command, HTTP/SSE url or websocket ws_url)."""
+    if not (config.get("command") or config.get("url") or config.get("ws_url")):
+        raise ValueError("config requires 'command' (stdio), 'url' (HTTP/SSE) or 'ws_url' (WebSocket)")
+    if "args" in config and not isinstance(config["args"], list):
+        raise ValueError("config 'args' must be a list")
+    if "env" in config and not isinstance(config["env"], dict):
+        raise ValueError("config 'env' must be an object")
+
+
 # ============================================
 # Request Schemas
 # ============================================
@@ -18,12 +28,23 @@ class AddServerRequest(BaseModel):
     config: Dict[str, Any] = Field(..., description="Server configuration (command, args, env, etc.)")
     enabled: bool = True
 
+    @model_validator(mode="after")
+    def _check_config(self):
+        _validate_server_config(self.config)
+        return self
+
 
 class UpdateServerRequest(BaseModel):
     """Request body for updating server configuration."""
     config: Optional[Dict[str, Any]] = None
     enabled: Optional[bool] = None
 
+    @model_validator(mode="after")
+    def _check_config(self):
+        if self.config is not None:
+            _validate_server_config(self.config)
+        return self
+
 
 class TestConnectionRequest(BaseModel):
     """Request body for testing server connection."""
@@ -40,7 +40,7 @@ async def login(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"OAuth Login error: {e}")
+        logger.error("OAuth Login error: %s", e)
         raise HTTPException(status_code=500, detail="Failed to initiate login")
 
 
@@ -103,7 +103,7 @@ async def callback(
             resolved_config = await build_mcp_config(target_app_id, user_id)
             if resolved_config:
                 await manager.save_server_config(target_app_id, resolved_config)
-                logger.info(f"Auto-configured and started {target_app_id} for user {user_id}")
+                logger.info("Auto-configured and started %s for user %s", target_app_id, user_id)
 
         # Append status=success
         from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
@@ -126,7 +126,7 @@ async def callback(
     except ValueError as e:
          return JSONResponse(status_code=400, content={"error": str(e)})
     except Exception as e:
-        logger.error(f"Callback error: {e}")
+        logger.error("Callback error: %s", e)
         import traceback
         logger.error(traceback.format_exc())
         return JSONResponse(status_code=500, content={"error": "Internal Server Error"})
@@ -3,8 +3,9 @@ MCP Registry routes.
 Provides access to the built-in MCP server registry (SPHERE_REGISTRY).
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, Query
+from functools import lru_cache
+from typing import Dict, List, Optional
+from fastapi import APIRouter, Query, Response
 from pydantic import BaseModel
 
 
@@ -49,6 +50,71 @@ class RegistryListResponse(BaseModel):
     categories: List[str]
 
 
+# ============================================
+# Cached Registry Views
+# ============================================
+
+def _to_app_response(app) -> RegistryAppResponse:
+    """Convert a SphereApp registry entry into its API response model."""
+    # Prepare OAuth Config Response
+    oauth_resp = None
+    if app.oauth_config:
+        oauth_resp = OAuthConfigResponse(
+            provider_name=app.oauth_config.provider_name,
+            pkce=app.oauth_config.pkce,
+            scopes=app.oauth_config.scopes
+        )
+    
+    return RegistryAppResponse(
+        id=app.id,
+        name=app.name,
+        description=app.description,
+        icon=app.icon,
+        category=app.category,
+        config_template=app.config_template,
+        auth_fields=[
+            AuthFieldResponse(
+                name=f.name,
+                label=f.label,
+                description=f.description,
+                type=f.type,
+                required=f.required,
+            )
+            for f in app.auth_fields
+        ],
+        is_custom=app.is_custom,
+        oauth_config=oauth_resp
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_app_responses() -> Dict[str, RegistryAppResponse]:
+    """
+    Build the response models for the static registry once.
+    SPHERE_REGISTRY never changes at runtime, so every request can reuse them.
+    """
+    from backend.app.core.mcp.registry import SPHERE_REGISTRY
+    
+    return {app.id: _to_app_response(app) for app in SPHERE_REGISTRY}
+
+
+@lru_cache(maxsize=1)
+def _get_categories() -> tuple:
+    """Sorted, de-duplicated categories of the registry (computed once)."""
+    return tuple(sorted({app.category for app in _get_app_responses().values()}))
+
+
+@lru_cache(maxsize=1)
+def _get_full_listing_json() -> bytes:
+    """Pre-serialized unfiltered /apps payload (the common case for the UI)."""
+    apps = list(_get_app_responses().values())
+    return RegistryListResponse(
+        apps=apps,
+        total=len(apps),
+        categories=list(_get_categories()),
+    ).model_dump_json().encode()
+
+
 # ============================================
 # Routes
 # ============================================
@@ -63,62 +129,28 @@ async def list_registry_apps(
     
     These are pre-configured MCP server templates that users can easily add.
     """
-    # Import the registry
-    try:
-        from backend.app.core.mcp.registry import SPHERE_REGISTRY, SphereApp
-    except ImportError:
-        # Fallback if import fails
-        return RegistryListResponse(apps=[], total=0, categories=[])
+    if not category and not search:
+        return Response(content=_get_full_listing_json(), media_type="application/json")
     
     apps = []
-    categories = set()
+    search_lower = search.lower() if search else None
+    category_lower = category.lower() if category else None
     
-    for app in SPHERE_REGISTRY:
-        categories.add(app.category)
-        
+    for app in _get_app_responses().values():
         # Apply filters
-        if category and app.category.lower() != category.lower():
+        if category_lower and app.category.lower() != category_lower:
             continue
         
-        if search:
-            search_lower = search.lower()
+        if search_lower:
             if search_lower not in app.name.lower() and search_lower not in app.description.lower():
                 continue
         
-        # Prepare OAuth Config Response
-        oauth_resp = None
-        if app.oauth_config:
-            oauth_resp = OAuthConfigResponse(
-                provider_name=app.oauth_config.provider_name,
-                pkce=app.oauth_config.pkce,
-                scopes=app.oauth_config.scopes
-            )
-        
-        apps.append(RegistryAppResponse(
-            id=app.id,
-            name=app.name,
-            description=app.description,
-            icon=app.icon,
-            category=app.category,
-            config_template=app.config_template,
-            auth_fields=[
-                AuthFieldResponse(
-                    name=f.name,
-                    label=f.label,
-                    description=f.description,
-                    type=f.type,
-                    required=f.required,
-                )
-                for f in app.auth_fields
-            ],
-            is_custom=app.is_custom,
-            oauth_config=oauth_resp
-        ))
+        apps.append(app)
     
     return RegistryListResponse(
         apps=apps,
         total=len(apps),
-        categories=sorted(list(categories)),
+        categories=list(_get_categories()),
     )
 
 
@@ -127,16 +159,7 @@ async def get_registry_app(app_id: str):
     """
     Get details for a specific registry app.
     """
-    try:
-        from backend.app.core.mcp.registry import get_app_by_id
-    except ImportError:
-        from fastapi import HTTPException, status
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"App '{app_id}' not found"
-        )
-    
-    app = get_app_by_id(app_id)
+    app = _get_app_responses().get(app_id)
     
     if not app:
         from fastapi import HTTPException, status
@@ -145,35 +168,7 @@ async def get_registry_app(app_id: str):
             detail=f"App '{app_id}' not found"
         )
     
-    # Prepare OAuth Config Response
-    oauth_resp = None
-    if app.oauth_config:
-        oauth_resp = OAuthConfigResponse(
-            provider_name=app.oauth_config.provider_name,
-            pkce=app.oauth_config.pkce,
-            scopes=app.oauth_config.scopes
-        )
-
-    return RegistryAppResponse(
-        id=app.id,
-        name=app.name,
-        description=app.description,
-        icon=app.icon,
-        category=app.category,
-        config_template=app.config_template,
-        auth_fields=[
-            AuthFieldResponse(
-                name=f.name,
-                label=f.label,
-                description=f.description,
-                type=f.type,
-                required=f.required,
-            )
-            for f in app.auth_fields
-        ],
-        is_custom=app.is_custom,
-        oauth_config=oauth_resp
-    )
+    return app
 
 
 @router.get("/categories", response_model=List[str])
@@ -181,14 +176,4 @@ async def list_categories():
     """
     List all available app categories.
     """
-    try:
-        from backend.app.core.mcp.registry import SPHERE_REGISTRY
-    except ImportError:
-        return []
-    
-    categories = set()
-    for app in SPHERE_REGISTRY:
-        categories.add(app.category)
-    
-    return sorted(list(categories))
-
+    return list(_get_categories())
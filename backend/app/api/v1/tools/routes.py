@@ -3,7 +3,6 @@ Tools management routes.
 Handles listing, enabling/disabling tools, and HITL configuration.
 """
 
-import fnmatch
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,6 +11,7 @@ from sqlalchemy import select
 from backend.app.dependencies import get_db, get_current_user
 from backend.app.models.user import User
 from backend.app.models.mcp_server import MCPServerConfig
+from backend.app.core.agents.hitl import matches_tool_patterns
 from backend.app.api.v1.tools.schemas import (
     ToggleToolRequest,
     ToggleHITLRequest,
@@ -26,11 +26,23 @@ router = APIRouter(prefix="/mcp/tools", tags=["MCP Tools"])
 
 
 def _tool_matches_hitl_pattern(tool_name: str, patterns: List[str]) -> bool:
-    """Check if tool name matches any HITL pattern."""
-    for pattern in patterns:
-        if fnmatch.fnmatch(tool_name.lower(), pattern.lower()):
-            return True
-    return False
+    """Check if tool name matches any HITL pattern (case-insensitive)."""
+    return matches_tool_patterns(tool_name, patterns, ignore_case=True)
+
+
+def _tool_info(server_name: str, tool: dict) -> ToolInfo:
+    """
+    Build ToolInfo from a manager status entry.
+    The manager produces these dicts itself, so skip re-validation.
+    """
+    return ToolInfo.model_construct(
+        name=tool["name"],
+        description=tool.get("description"),
+        server_name=server_name,
+        enabled=tool["enabled"],
+        requires_approval=tool["hitl"],
+        input_schema=tool.get("input_schema")
+    )
 
 
 @router.get("/", response_model=ToolListResponse)
@@ -49,14 +61,7 @@ async def list_all_tools(
     
     for server_name, status in all_status.items():
         for tool in status.get("tools", []):
-            all_tools.append(ToolInfo(
-                name=tool["name"],
-                description=tool.get("description"),
-                server_name=server_name,
-                enabled=tool["enabled"],
-                requires_approval=tool["hitl"],
-                input_schema=None # manager doesn't cache schema yet, but could wrap
-            ))
+            all_tools.append(_tool_info(server_name, tool))
             
     return ToolListResponse(tools=all_tools, total=len(all_tools))
 
@@ -82,16 +87,7 @@ async def get_server_tools(
             detail=f"Server '{server_name}' not found or disconnected"
         )
     
-    tools = [
-        ToolInfo(
-            name=t["name"],
-            description=t.get("description"),
-            server_name=server_name,
-            enabled=t["enabled"],
-            requires_approval=t["hitl"]
-        )
-        for t in server_status.get("tools", [])
-    ]
+    tools = [_tool_info(server_name, t) for t in server_status.get("tools", [])]
     
     return ServerToolsResponse(
         server_name=server_name,
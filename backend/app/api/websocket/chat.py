@@ -2,11 +2,11 @@
 WebSocket handler for real-time chat streaming.
 """
 
-import json
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, TypedDict
 from uuid import UUID
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, Query
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -14,12 +14,28 @@ from backend.app.db import AsyncSessionLocal
 from backend.app.models.user import User
 from backend.app.models.conversation import Conversation
 from backend.app.core.auth import decode_token
+from backend.app.core import jsonutil
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["WebSocket"])
 
 
+class ClientMessage(TypedDict, total=False):
+    """Inbound WebSocket frame from the client."""
+    type: str
+    content: str
+
+
+# Built once: parses and validates a frame in a single pydantic-core pass
+_client_message_adapter = TypeAdapter(ClientMessage)
+
+
+async def _send_event(websocket: WebSocket, event: Dict[str, Any]):
+    """Send one event as a JSON text frame."""
+    await websocket.send_text(jsonutil.dumps(event).decode())
+
+
 class ConnectionManager:
     """Manages WebSocket connections."""
     
@@ -36,7 +52,7 @@ class ConnectionManager:
     
     async def send_event(self, thread_id: str, event: Dict[str, Any]):
         if thread_id in self.active_connections:
-            await self.active_connections[thread_id].send_json(event)
+            await _send_event(self.active_connections[thread_id], event)
 
 
 manager = ConnectionManager()
@@ -106,7 +122,7 @@ async def websocket_chat(
             conversation = result.scalar_one_or_none()
             
             if not conversation:
-                await websocket.send_json({
+                await _send_event(websocket, {
                     "type": "error",
                     "message": "Conversation not found"
                 })
@@ -114,7 +130,7 @@ async def websocket_chat(
                 return
             
             # Send connected confirmation
-            await websocket.send_json({
+            await _send_event(websocket, {
                 "type": "status",
                 "content": "Connected to chat"
             })
@@ -124,11 +140,13 @@ async def websocket_chat(
                 data = await websocket.receive_text()
                 
                 try:
-                    message = json.loads(data)
-                except json.JSONDecodeError:
-                    await websocket.send_json({
+                    message = _client_message_adapter.validate_json(data)
+                except ValidationError as e:
+                    # Malformed JSON and a well-formed but wrong-shaped message both land here
+                    error = e.errors()[0]
+                    await _send_event(websocket, {
                         "type": "error",
-                        "message": "Invalid JSON"
+                        "message": "Invalid JSON" if error["type"] == "json_invalid" else f"Invalid message: {error['msg']}"
                     })
                     continue
                 
@@ -137,7 +155,7 @@ async def websocket_chat(
                 if msg_type == "message":
                     content = message.get("content", "").strip()
                     if not content:
-                        await websocket.send_json({
+                        await _send_event(websocket, {
                             "type": "error",
                             "message": "Empty message"
                         })
@@ -161,28 +179,28 @@ async def websocket_chat(
                     
                     final_response = ""
                     async for event in chat_service.process_message(conversation, content):
-                        await websocket.send_json(event)
+                        await _send_event(websocket, event)
                         
                         if event.get("type") == "token":
                             final_response += event.get("content", "")
                     
                     # Send done event
-                    await websocket.send_json({
+                    await _send_event(websocket, {
                         "type": "done",
                         "final_response": final_response
                     })
                     
                 elif msg_type == "ping":
-                    await websocket.send_json({"type": "pong"})
+                    await _send_event(websocket, {"type": "pong"})
                     
                 # Removed hitl_decision: WebSocket handling for HITL is deprecated in favor of REST API /resume
                 
     except WebSocketDisconnect:
-        logger.info(f"WebSocket disconnected: {thread_id}")
+        logger.info("WebSocket disconnected: %s", thread_id)
     except Exception as e:
-        logger.error(f"WebSocket error: {e}")
+        logger.error("WebSocket error: %s", e)
         try:
-            await websocket.send_json({
+            await _send_event(websocket, {
                 "type": "error",
                 "message": str(e)
             })
@@ -9,6 +9,7 @@ import os
 import logging
 from typing import List
 from uuid import UUID
+from langchain_core.messages import HumanMessage, AIMessage
 from backend.app.core.agents.planner import Planner
 from backend.app.core.agents.agent import Agent
 from backend.app.core.mcp.manager import MCPManager
@@ -192,11 +193,10 @@ async def main():
                     print("\n🤖: ", end="", flush=True)
                     prefix_printed = True
                 
-                from langchain_core.messages import HumanMessage, AIMessage
                 history.append(HumanMessage(content=user_input))
                 
                 full_agent_response = ""
-                async for event in agent.execute_streaming(user_input, history[:-1]):
+                async for event in agent.execute_streaming(user_input, history[:-1], thread_id=thread_id):
                     etype = event.get("type")
                     
                     if etype == "token":
@@ -224,7 +224,7 @@ async def main():
                             # Restart the generator with the SAME history and input
                             # The whitelist ensures it won't trigger again
                             full_agent_response = ""
-                            async for sub_event in agent.execute_streaming(user_input, history[:-1]):
+                            async for sub_event in agent.execute_streaming(user_input, history[:-1], thread_id=thread_id):
                                 sex_type = sub_event.get("type")
                                 if sex_type == "token":
                                     content = sub_event.get("content", "")
@@ -252,7 +252,6 @@ async def main():
                      print(f"\n🤖: {plan['response']}")
                 
                 print("\n")
-                from langchain_core.messages import HumanMessage, AIMessage
                 history.append(HumanMessage(content=user_input))
                 history.append(AIMessage(content=plan.get("response", full_direct_response)))
             
@@ -291,7 +290,12 @@ if __name__ == "__main__":
     if os.name == 'nt':
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
     
-    loop = asyncio.new_event_loop()
+    # uvloop (installed with uvicorn[standard]) is a faster drop-in loop; not available on Windows
+    try:
+        import uvloop
+        loop = uvloop.new_event_loop()
+    except ImportError:
+        loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     loop.set_exception_handler(custom_exception_handler)
     
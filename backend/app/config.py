@@ -54,6 +54,12 @@ class AppConfig(BaseSettings):
     # HITL
     HITL_REQUEST_TIMEOUT_SECONDS: int = 300
     
+    # Planner
+    PLANNER_HISTORY_MESSAGES: int = 40  # Most recent messages sent to the router (0 = all)
+    
+    # MCP
+    MCP_MAX_CONCURRENT_CONNECTIONS: int = 5  # Parallel server spawns per user
+    
     # OAuth
     GOOGLE_CLIENT_ID: Optional[str] = os.getenv("GOOGLE_CLIENT_ID")
     GOOGLE_CLIENT_SECRET: Optional[str] = os.getenv("GOOGLE_CLIENT_SECRET")
@@ -62,6 +68,12 @@ class AppConfig(BaseSettings):
     GITHUB_CLIENT_ID: Optional[str] = os.getenv("GITHUB_CLIENT_ID")
     GITHUB_CLIENT_SECRET: Optional[str] = os.getenv("GITHUB_CLIENT_SECRET")
     
+    # Outbound HTTP (OAuth token / discovery endpoints)
+    # HTTP/2 requires the optional `h2` package (pip install "httpx[http2]")
+    HTTP2_ENABLED: bool = False
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    
     model_config = SettingsConfigDict(
         env_file=str(ENV_FILE),
         env_file_encoding="utf-8",
@@ -72,9 +84,7 @@ class AppConfig(BaseSettings):
     @property
     def cors_origins_list(self) -> List[str]:
         """Parse CORS_ORIGINS string into list."""
-        if isinstance(self.CORS_ORIGINS, str):
-            return [origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip()]
-        return self.CORS_ORIGINS
+        return [origin for origin in map(str.strip, self.CORS_ORIGINS.split(",")) if origin]
 
 
 @lru_cache()
@@ -6,16 +6,47 @@ No custom error handling or approval middleware needed.
 """
 
 import logging
-import fnmatch
-from typing import List, Optional, Any, Dict, AsyncGenerator
+from typing import List, Optional, Any, Dict, AsyncGenerator, Required, TypedDict
 from langchain_core.messages import BaseMessage, AIMessage, ToolMessage
 from langchain.agents import create_agent
 from langchain.agents.middleware import HumanInTheLoopMiddleware
 from langgraph.types import Command
 from langgraph.errors import GraphRecursionError
 
+from backend.app.core.agents.hitl import compile_tool_patterns
+
 logger = logging.getLogger(__name__)
 
+
+class AgentEvent(TypedDict, total=False):
+    """
+    Event yielded by the streaming methods. A plain dict at runtime, so it is
+    serialized as-is by the SSE/WebSocket layers; keys present depend on `type`.
+    """
+    type: Required[str]  # token | tool_start | tool_end | approval_required | error
+    content: Any  # token, error
+    tool: str  # tool_start, tool_end
+    inputs: Dict[str, Any]  # tool_start
+    output: str  # tool_end
+    tool_name: Optional[str]  # approval_required
+    tool_args: Dict[str, Any]  # approval_required
+    description: str  # approval_required
+    allowed_decisions: List[str]  # approval_required
+
+
+def _summarize_action_request(interrupt_value: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Pull tool name/args/description from the first pending HITL action request."""
+    requests = interrupt_value.get("action_requests")
+    if not requests:
+        return None
+    r = requests[0]
+    return {
+        "tool_name": r.get("name"),
+        # Robust extract: check multiple common keys
+        "tool_args": r.get("arguments") or r.get("args") or r.get("inputs") or {},
+        "description": r.get("description") or "Action requires approval",
+    }
+
 # AGENT_SYSTEM_PROMPT = """YOU ARE A PROACTIVE, HIGH-EXECUTION MULTI-TOOL AGENT.
 # 1. **TOOL PRIORITY**: If you have been called, it's because tools are required. ALWAYS prioritize using tools over simple conversation.
 # 2. **SELF-HEALING**: If a tool fails (e.g., missing parameters, invalid inputs), do not give up. Search for missing metadata or try an alternative tool/approach.
@@ -147,7 +178,11 @@ class Agent:
             checkpointer=checkpointer,
         )
         
-        logger.info(f"Agent created with {len(tools)} tools, HITL patterns: {list(interrupt_on.keys()) if interrupt_on else 'none'}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Agent created with %d tools, HITL patterns: %s",
+                len(tools), list(interrupt_on) if interrupt_on else "none",
+            )
     
     def _build_interrupt_config(
         self, 
@@ -164,7 +199,7 @@ class Agent:
             return {}
         
         mode = hitl_config.get("mode", "denylist")
-        patterns = hitl_config.get("sensitive_tools", [])
+        hitl_regex = compile_tool_patterns(hitl_config.get("sensitive_tools", []))
         
         interrupt_on = {}
         
@@ -176,11 +211,7 @@ class Agent:
                 interrupt_on[tool_name] = True
             else:
                 # In denylist mode, check against glob patterns
-                needs_approval = any(
-                    fnmatch.fnmatch(tool_name, pattern) 
-                    for pattern in patterns
-                )
-                if needs_approval:
+                if hitl_regex is not None and hitl_regex.match(tool_name):
                     interrupt_on[tool_name] = True
         
         return interrupt_on
@@ -190,7 +221,7 @@ class Agent:
         user_input: str, 
         history: List[BaseMessage],
         thread_id: str
-    ) -> AsyncGenerator[Dict[str, Any], None]:
+    ) -> AsyncGenerator[AgentEvent, None]:
         """
         Execute agent and yield structured events.
         
@@ -228,7 +259,7 @@ class Agent:
             if current_state and current_state.values and "messages" in current_state.values:
                 state_messages = current_state.values["messages"]
                 if state_messages and isinstance(state_messages[-1], AIMessage) and state_messages[-1].tool_calls:
-                    logger.warning(f"Found dangling tool calls in thread {thread_id}. Attempting repair...")
+                    logger.warning("Found dangling tool calls in thread %s. Attempting repair...", thread_id)
                     tool_outputs = []
                     for tc in state_messages[-1].tool_calls:
                         tool_outputs.append(
@@ -248,8 +279,9 @@ class Agent:
             ):
                 if mode == "messages":
                     token, metadata = chunk
-                    if not isinstance(token, ToolMessage) and hasattr(token, 'content') and token.content:
-                        yield {"type": "token", "content": token.content}
+                    content = getattr(token, "content", None)
+                    if content and not isinstance(token, ToolMessage):
+                        yield {"type": "token", "content": content}
                 
                 elif mode == "updates":
                     # Check for interrupts/approval
@@ -286,14 +318,14 @@ class Agent:
             logger.error("GraphRecursionError - task too complex")
             yield {"type": "error", "content": "⚠️ Task too complex or loop detected."}
         except Exception as e:
-            logger.error(f"Streaming error: {e}", exc_info=True)
+            logger.error("Streaming error: %s", e, exc_info=True)
             yield {"type": "error", "content": f"Error: {str(e)}"}
 
     async def resume_streaming(
         self,
         thread_id: str,
         decisions: List[Dict[str, Any]]
-    ) -> AsyncGenerator[Dict[str, Any], None]:
+    ) -> AsyncGenerator[AgentEvent, None]:
         """
         Resume execution after HITL approval.
         
@@ -334,8 +366,9 @@ class Agent:
                     
                     if len(pending_requests) > len(decisions):
                         logger.warning(
-                            f"HITL Decision Mismatch: Pending {len(pending_requests)} requests, "
-                            f"received {len(decisions)} decisions. Reconciling..."
+                            "HITL Decision Mismatch: Pending %s requests, "
+                            "received %s decisions. Reconciling...",
+                            len(pending_requests), len(decisions),
                         )
                         
                         # We need valid decisions for ALL pending requests.
@@ -374,8 +407,9 @@ class Agent:
                 if mode == "messages":
                     token, metadata = chunk
                     # Check if it's a ToolMessage or just text content
-                    if not isinstance(token, ToolMessage) and hasattr(token, 'content') and token.content:
-                        yield {"type": "token", "content": token.content}
+                    content = getattr(token, "content", None)
+                    if content and not isinstance(token, ToolMessage):
+                        yield {"type": "token", "content": content}
                 
                 elif mode == "updates":
                     # Check for another interrupt (chained approvals)
@@ -405,7 +439,7 @@ class Agent:
                                 }
                             
         except Exception as e:
-            logger.error(f"Resume error: {e}", exc_info=True)
+            logger.error("Resume error: %s", e, exc_info=True)
             yield {"type": "error", "content": f"Resume error: {str(e)}"}
 
     async def get_pending_interrupt(self, thread_id: str) -> Optional[Dict[str, Any]]:
@@ -427,36 +461,23 @@ class Agent:
             if state and state.tasks:
                 for task in state.tasks:
                     if hasattr(task, 'interrupts') and task.interrupts:
-                        interrupt_val = task.interrupts[0].value
-                        requests = interrupt_val.get("action_requests", [])
-                        if requests:
-                            r = requests[0]
-                            args = r.get("arguments") or r.get("args") or r.get("inputs") or {}
-                            return {
-                                "tool_name": r.get("name"),
-                                "tool_args": args,
-                                "description": r.get("description") or "Action requires approval",
-                            }
+                        action = _summarize_action_request(task.interrupts[0].value)
+                        if action:
+                            return action
             return None
         except Exception as e:
-            logger.warning(f"Error checking pending interrupt: {e}")
+            logger.warning("Error checking pending interrupt: %s", e)
             return None
 
-    def _extract_action_info(self, chunk: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _extract_action_info(self, chunk: Dict[str, Any]) -> Optional[AgentEvent]:
         """Helper to extract action info from a LangGraph interrupt chunk."""
-        if "__interrupt__" in chunk:
-            interrupt = chunk["__interrupt__"][0]
-            val = interrupt.value
-            requests = val.get("action_requests", [])
-            if requests:
-                r = requests[0]
-                # Robust extract: check multiple common keys
-                args = r.get("arguments") or r.get("args") or r.get("inputs") or {}
+        interrupts = chunk.get("__interrupt__")
+        if interrupts:
+            action = _summarize_action_request(interrupts[0].value)
+            if action:
                 return {
                     "type": "approval_required",
-                    "tool_name": r.get("name"),
-                    "tool_args": args,
-                    "description": r.get("description") or "Action requires approval",
+                    **action,
                     "allowed_decisions": ["approve", "reject", "edit"]
                 }
         return None
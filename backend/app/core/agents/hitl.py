@@ -0,0 +1,32 @@
+"""
+HITL tool-pattern matching.
+
+User HITL configs list glob patterns (e.g. "*delete*") for tools that need
+approval. Patterns are translated and fused into a single compiled regex once
+per distinct pattern list, so checking a tool is one regex match instead of an
+fnmatch call per pattern.
+"""
+
+import re
+import fnmatch
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
+
+
+@lru_cache(maxsize=128)
+def _compile(patterns: Tuple[str, ...], ignore_case: bool) -> Optional[re.Pattern]:
+    if not patterns:
+        return None
+    fused = "|".join(fnmatch.translate(p) for p in patterns)
+    return re.compile(fused, re.IGNORECASE if ignore_case else 0)
+
+
+def compile_tool_patterns(patterns: Iterable[str], ignore_case: bool = False) -> Optional[re.Pattern]:
+    """Get the fused regex for a list of glob patterns (None if there are none)."""
+    return _compile(tuple(patterns), ignore_case)
+
+
+def matches_tool_patterns(tool_name: str, patterns: Iterable[str], ignore_case: bool = False) -> bool:
+    """Check if a tool name matches any of the glob patterns."""
+    regex = compile_tool_patterns(patterns, ignore_case)
+    return regex is not None and regex.match(tool_name) is not None
@@ -1,10 +1,52 @@
 import json
 import logging
-from typing import Dict, List, Any, Union, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Union, Optional, Mapping
 from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
+from backend.app.config import config
 
 logger = logging.getLogger(__name__)
 
+# Enhanced Server Descriptions
+KNOWN_CAPABILITIES: Mapping[str, str] = MappingProxyType({
+    "github": "Access repositories, issues, PRs, and files on GitHub.",
+    "zoho": "Integration with Zoho suite. Use for Zoho Mail and Zoho Cliq (messaging, teams, user lookup).",
+    "filesystem": "Read/write/list local files.",
+    "firecrawl-mcp": "Web scraping and crawling (single or multi-page).",
+    "playwright-mcp": "Browser automation for dynamic sites.",
+    "youtube": "Search videos and get transcripts.",
+    "gmail": "Send, read, and search emails.",
+    "notion": "Interact with Notion pages and databases.",
+    "google-drive": "Manage Google Drive files."
+})
+
+# Router prompt; the only per-call part is the server list (filled via %)
+_SYSTEM_PROMPT_TEMPLATE = """You are the Task Router for AgentSphere-AI.
+Analyze the user query and history to decide if you need tools (MCP servers) or can respond directly.
+
+AVAILABLE MCP SERVERS:
+%s
+
+RULES:
+1. **COMMON KNOWLEDGE**: Respond directly for general info.
+2. **TOOL NECESSITY**: Only select MCP servers for real-time/external data.
+3. If the user is just chatting, respond directly.
+4. **HISTORY ACCESS**: You HAVE access to the history of this specific conversation. Use it to answer questions about previous turns. Never say "I don't have access to your chat history" for messages visible in the HISTORY block.
+5. Output MUST be valid JSON.
+6. **STRICT EXCLUSIVITY**: If `servers` is not empty, `response` MUST be `null`. Never provide a preamble like "I will help you...". Just select the server and let the agent handle everything.
+
+JSON FORMAT:
+{
+  "response": "Brief direct response or null",
+  "servers": ["list", "of", "server", "names", "if", "tools", "needed"]
+}
+"""
+
+_RESPONSE_FIELD = '"response":'
+
+# JSON string escapes decoded while streaming the "response" field
+_JSON_ESCAPES = MappingProxyType({'"': '"', 'n': '\n', 'r': '\r', 't': '\t', '\\': '\\'})
+
 class Planner:
     """
     The 'Brain' of the system. Implements a Single-Call Router logic.
@@ -37,49 +79,22 @@ class Planner:
         """
         Plans the task and yields either tokens (for direct response) or the final plan dict.
         """
-        # Enhanced Server Descriptions
-        known_capabilities = {
-            "github": "Access repositories, issues, PRs, and files on GitHub.",
-            "zoho": "Integration with Zoho suite. Use for Zoho Mail and Zoho Cliq (messaging, teams, user lookup).",
-            "filesystem": "Read/write/list local files.",
-            "firecrawl-mcp": "Web scraping and crawling (single or multi-page).",
-            "playwright-mcp": "Browser automation for dynamic sites.",
-            "youtube": "Search videos and get transcripts.",
-            "gmail": "Send, read, and search emails.",
-            "notion": "Interact with Notion pages and databases.",
-            "google-drive": "Manage Google Drive files."
-        }
-        
         server_descriptions = []
         for name, info in available_servers.items():
-            desc = info.get('description') or known_capabilities.get(name, 'No description available')
+            desc = info.get('description') or KNOWN_CAPABILITIES.get(name, 'No description available')
             server_descriptions.append(f"- {name}: {desc}")
         server_text = "\n".join(server_descriptions)
 
-        system_prompt = f"""You are the Task Router for AgentSphere-AI.
-Analyze the user query and history to decide if you need tools (MCP servers) or can respond directly.
-
-AVAILABLE MCP SERVERS:
-{server_text}
-
-RULES:
-1. **COMMON KNOWLEDGE**: Respond directly for general info.
-2. **TOOL NECESSITY**: Only select MCP servers for real-time/external data.
-3. If the user is just chatting, respond directly.
-4. **HISTORY ACCESS**: You HAVE access to the history of this specific conversation. Use it to answer questions about previous turns. Never say "I don't have access to your chat history" for messages visible in the HISTORY block.
-5. Output MUST be valid JSON.
-6. **STRICT EXCLUSIVITY**: If `servers` is not empty, `response` MUST be `null`. Never provide a preamble like "I will help you...". Just select the server and let the agent handle everything.
-
-JSON FORMAT:
-{{
-  "response": "Brief direct response or null",
-  "servers": ["list", "of", "server", "names", "if", "tools", "needed"]
-}}
-"""
+        system_prompt = _SYSTEM_PROMPT_TEMPLATE % server_text
         # Filter history to avoid duplicating the current query if it's already saved
         display_history = history
         if history and hasattr(history[-1], 'content') and history[-1].content == user_input:
             display_history = history[:-1]
+        
+        # Bound the routing prompt to the most recent turns so its size stays flat in long chats
+        window = config.PLANNER_HISTORY_MESSAGES
+        if window and len(display_history) > window:
+            display_history = display_history[-window:]
 
         messages = [
             {"role": "system", "content": system_prompt},
@@ -101,8 +116,8 @@ JSON FORMAT:
                 if not response_processed:
                     if not response_started:
                         # 1. Search for "response": field
-                        if '"response":' in full_content:
-                            p_idx = full_content.find('"response":') + 11
+                        if _RESPONSE_FIELD in full_content:
+                            p_idx = full_content.find(_RESPONSE_FIELD) + len(_RESPONSE_FIELD)
                             # Look ahead for opening quote or null
                             after_field = full_content[p_idx:].lstrip()
                             if after_field:
@@ -127,12 +142,7 @@ JSON FORMAT:
                                 # Check if we have the escaped character yet
                                 if curr_idx + 1 < len(full_content):
                                     esc = full_content[curr_idx + 1]
-                                    if esc == '"': to_yield += '"'
-                                    elif esc == 'n': to_yield += '\n'
-                                    elif esc == 'r': to_yield += '\r'
-                                    elif esc == 't': to_yield += '\t'
-                                    elif esc == '\\': to_yield += '\\'
-                                    else: to_yield += esc # literal fallback
+                                    to_yield += _JSON_ESCAPES.get(esc, esc) # literal fallback
                                     curr_idx += 2
                                     continue
                                 else:
@@ -184,5 +194,5 @@ JSON FORMAT:
                     yield {"response": full_content, "servers": []}
                 
         except Exception as e:
-            logger.error(f"Planning failed: {e}")
-            yield {"response": "I encountered an error planning your task.", "servers": []}
\ No newline at end of file
+            logger.error("Planning failed: %s", e)
+            yield {"response": "I encountered an error planning your task.", "servers": [], "error": True}
\ No newline at end of file
@@ -5,13 +5,13 @@ Migrated and enhanced from src/core/auth/security.py
 
 import os
 import logging
-import json
 from passlib.context import CryptContext
 from cryptography.fernet import Fernet
 from functools import lru_cache
 
 from typing import Any, Dict
 from backend.app.config import config
+from backend.app.core import jsonutil
 
 logger = logging.getLogger(__name__)
 
@@ -68,7 +68,7 @@ def decrypt_value(encrypted_value: str) -> str:
         cipher = _get_cipher()
         return cipher.decrypt(encrypted_value.encode()).decode()
     except Exception as e:
-        logger.error(f"Decryption failed: {e}")
+        logger.error("Decryption failed: %s", e)
         return "[DECRYPTION_FAILED]"
 
 
@@ -86,18 +86,18 @@ def encrypt_config(config: Dict[str, Any]) -> Dict[str, Any]:
         return {}
         
     try:
-        # Convert to JSON string
-        json_str = json.dumps(config)
+        # Convert to JSON bytes
+        json_bytes = jsonutil.dumps(config)
         
         # Encrypt
         cipher = _get_cipher()
-        encrypted_bytes = cipher.encrypt(json_str.encode())
+        encrypted_bytes = cipher.encrypt(json_bytes)
         encrypted_str = encrypted_bytes.decode()
         
         return {"encrypted": encrypted_str}
         
     except Exception as e:
-        logger.error(f"Failed to encrypt config: {e}")
+        logger.error("Failed to encrypt config: %s", e)
         raise ValueError("Configuration encryption failed")
 
 
@@ -119,10 +119,9 @@ def decrypt_config(config: Dict[str, Any]) -> Dict[str, Any]:
             encrypted_str = config["encrypted"]
             cipher = _get_cipher()
             decrypted_bytes = cipher.decrypt(encrypted_str.encode())
-            decrypted_str = decrypted_bytes.decode()
-            return json.loads(decrypted_str)
+            return jsonutil.loads(decrypted_bytes)
         except Exception as e:
-            logger.error(f"Failed to decrypt config: {e}")
+            logger.error("Failed to decrypt config: %s", e)
             # Identify if this is a critical failure or corrupt data
             return {}
             
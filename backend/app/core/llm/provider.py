@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional
 import os
 import logging
 from langchain_core.language_models import BaseChatModel
@@ -93,6 +94,18 @@ class GroqProvider(LLMProvider):
         )
 
 
+# Providers are stateless, so one shared read-only registry serves every call
+_claude_provider = ClaudeProvider()
+PROVIDERS: Mapping[str, LLMProvider] = MappingProxyType({
+    "openai": OpenAIProvider(),
+    "gemini": GeminiProvider(),
+    "claude": _claude_provider,
+    "groq": GroqProvider(),
+    "openrouter": OpenROuterProvider(),
+    "anthropic": _claude_provider
+})
+
+
 class LLMFactory:
     """Factory to create LLM instances based on configuration."""
     
@@ -100,16 +113,7 @@ class LLMFactory:
     def create_llm(config: Dict[str, Any]) -> BaseChatModel:
         provider_name = config.get("provider", "openai").lower()
         
-        providers = {
-            "openai": OpenAIProvider(),
-            "gemini": GeminiProvider(),
-            "claude": ClaudeProvider(),
-            "groq": GroqProvider(),
-            "openrouter": OpenROuterProvider(),
-            "anthropic": ClaudeProvider()
-        }
-        
-        provider = providers.get(provider_name)
+        provider = PROVIDERS.get(provider_name)
         if not provider:
             raise ValueError(f"Unsupported LLM provider: {provider_name}")
             
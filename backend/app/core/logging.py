@@ -1,8 +1,31 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
 from backend.app.config import config
 
+# Background listener that does the actual handler I/O (set by setup_logging)
+_listener: Optional[QueueListener] = None
+
 def setup_logging():
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+
+    # Log calls only enqueue the record; stderr writes happen on the listener thread
+    log_queue = queue.SimpleQueue()
     logging.basicConfig(
         level=logging.DEBUG if config.DEBUG else logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[QueueHandler(log_queue)],
     )
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
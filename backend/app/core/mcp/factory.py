@@ -1,5 +1,6 @@
 from typing import Dict, Any, Optional
 import os
+import re
 import logging
 from backend.app.core.mcp.registry import SPHERE_REGISTRY, get_app_by_id
 from backend.app.core.oauth.service import oauth_service
@@ -7,6 +8,9 @@ from backend.app.core.state.models import MCPServerConfig
 
 logger = logging.getLogger(__name__)
 
+# Matches "${VAR}" placeholders in registry config templates
+_PLACEHOLDER_RE = re.compile(r"\$\{(.+?)\}")
+
 async def build_mcp_config(server_name: str, user_id: str, db_config: Optional[MCPServerConfig] = None) -> Optional[Dict[str, Any]]:
     """
     Constructs the mcp-use configuration for a given server.
@@ -15,7 +19,7 @@ async def build_mcp_config(server_name: str, user_id: str, db_config: Optional[M
     # 1. Get Base Template from Registry
     app_def = get_app_by_id(server_name)
     if not app_def:
-        logger.warning(f"Server {server_name} not found in registry")
+        logger.warning("Server %s not found in registry", server_name)
         return None
 
     config_template = app_def.config_template.copy()
@@ -26,13 +30,6 @@ async def build_mcp_config(server_name: str, user_id: str, db_config: Optional[M
         if isinstance(val, str) and "${" in val and "}" in val:
             # Handle multiple placeholders in one string if needed, 
             # but simple case: "${VAR}"
-            import re
-            pattern = re.compile(r"\$\{(.+?)\}")
-            
-            async def replace_match(match):
-                var_name = match.group(1)
-                return await _get_var_value(var_name, user_id, app_def)
-            
             # If the whole string is exactly one placeholder, we might want to return 
             # the object (e.g. dict for auth), but usually placeholders are strings.
             if val.startswith("${") and val.endswith("}") and val.count("${") == 1:
@@ -40,7 +37,7 @@ async def build_mcp_config(server_name: str, user_id: str, db_config: Optional[M
             
             # For composite strings (e.g. "Bearer ${TOKEN}")
             result = val
-            for match in pattern.finditer(val):
+            for match in _PLACEHOLDER_RE.finditer(val):
                 placeholder = match.group(0)
                 var_name = match.group(1)
                 replacement = await _get_var_value(var_name, user_id, app_def)
@@ -78,7 +75,7 @@ async def build_mcp_config(server_name: str, user_id: str, db_config: Optional[M
              if is_bypass:
                  # Key-in-URL auth: remove auth header entirely, URL has the key
                  del config_template["auth"]
-                 logger.info(f"Bypass auth detected for {server_name}, removing auth header (key in URL)")
+                 logger.info("Bypass auth detected for %s, removing auth header (key in URL)", server_name)
              elif not resolved_auth and not app_def.oauth_config:
                  del config_template["auth"]
              elif resolved_auth:
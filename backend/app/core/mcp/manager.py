@@ -12,10 +12,12 @@ Refactored to remove redundant layers and confusing implementations.
 import os
 import asyncio
 import logging
+import time
 import json
 import shutil
-import fnmatch
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple, Callable, Awaitable, Mapping
 from pathlib import Path
 
 from mcp_use.client import MCPClient
@@ -27,10 +29,44 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.app.db import async_engine
 from backend.app.core.state.models import User, MCPServerConfig
 from backend.app.core.auth.security import decrypt_config, encrypt_config
-from backend.app.config import PROJECT_ROOT
+from backend.app.core.agents.hitl import compile_tool_patterns
+from backend.app.config import PROJECT_ROOT, config as app_config
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only fallback for servers missing from the config cache
+_EMPTY_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
+# Root of the per-user, per-server isolated HOME directories for file-based auth
+TOKENS_ROOT = PROJECT_ROOT / "backend" / "temp" / "tokens"
+
+# How long a session's list_tools result is reused before asking the server again
+TOOLS_CACHE_TTL_SECONDS = 60
+
+
+@dataclass(slots=True)
+class _ListToolsResult:
+    """Wrap list in object expected by load_mcp_tools adapter."""
+    tools: List[Any]
+    nextCursor: Optional[str] = None
+
+
+@dataclass(slots=True)
+class _SessionAdapter:
+    """
+    Simple adapter to make mcp-use session look like official python-sdk session.
+    This allows load_mcp_tools to work.
+    """
+    name: str
+    session: Any
+    list_raw_tools: Callable[[str, Any], Awaitable[List[Any]]]
+
+    async def list_tools(self, cursor=None) -> _ListToolsResult:
+        return _ListToolsResult(await self.list_raw_tools(self.name, self.session))
+
+    async def call_tool(self, name, arguments, **kwargs):
+        return await self.session.call_tool(name, arguments)
+
 
 class MCPManager:
     """
@@ -48,6 +84,15 @@ class MCPManager:
         # ACTOR 2: Configuration Cache
         self._server_configs: Dict[str, Dict] = {}
         self._hitl_config: Dict[str, Any] = {}
+        
+        # ACTOR 3: Tool listing cache { server_name: (expires_at_monotonic, tools) }
+        self._tools_cache: Dict[str, Tuple[float, List[Any]]] = {}
+        
+        # Caps concurrent server spawns across every connect fan-out for this user
+        self._connect_sem = asyncio.Semaphore(app_config.MCP_MAX_CONCURRENT_CONNECTIONS)
+        
+        # Per-user token directory (joined once, reused for every server)
+        self._tokens_dir = TOKENS_ROOT / str(user_id)
 
     @property
     def hitl_config(self) -> Dict[str, Any]:
@@ -142,37 +187,38 @@ class MCPManager:
                 # Set a timeout so we don't hang the whole callback if mcp-use stalls
                 await asyncio.wait_for(self._connect_single(name, config), timeout=15.0)
             except asyncio.TimeoutError:
-                logger.error(f"⌛ Connection timeout for {name} during auto-config")
+                logger.error("⌛ Connection timeout for %s during auto-config", name)
             except Exception as e:
-                logger.error(f"❌ Failed to connect to {name} during auto-config: {e}")
+                logger.error("❌ Failed to connect to %s during auto-config: %s", name, e)
 
     async def toggle_server_status(self, name: str, enabled: bool) -> bool:
         """Enable or disable a server."""
         if name not in self._server_configs:
             return False
             
+        # Single UPDATE instead of SELECT + mutate + flush
         async with AsyncSession(async_engine) as session:
-            stmt = select(MCPServerConfig).where(
+            stmt = update(MCPServerConfig).where(
                 MCPServerConfig.user_id == self.user_id,
                 MCPServerConfig.name == name
-            )
-            row = (await session.execute(stmt)).scalar_one_or_none()
-            if row:
-                row.enabled = enabled
-                await session.commit()
-                # Update cache
-                self._server_configs[name]["enabled"] = enabled
-                
-                # Proactive management:
-                if enabled:
-                    # Sync connection so tools are available before response
-                    await self._connect_single(name, self._server_configs[name])
-                else:
-                    # Disconnect immediately if disabled
-                    await self.disconnect_server(name)
-                
-                return True
-        return False
+            ).values(enabled=enabled)
+            result = await session.execute(stmt)
+            await session.commit()
+            if not result.rowcount:
+                return False
+
+        # Update cache
+        self._server_configs[name]["enabled"] = enabled
+        
+        # Proactive management:
+        if enabled:
+            # Sync connection so tools are available before response
+            await self._connect_single(name, self._server_configs[name])
+        else:
+            # Disconnect immediately if disabled
+            await self.disconnect_server(name)
+        
+        return True
         
     async def remove_server(self, name: str) -> bool:
         """Fully remove a server: disconnect and delete config."""
@@ -208,10 +254,10 @@ class MCPManager:
                 if config.get("enabled", True):
                    tasks.append(self._connect_single(name, config))
             else:
-                logger.warning(f"Server {name} not found in config")
+                logger.warning("Server %s not found in config", name)
         
         if tasks:
-            await asyncio.gather(*tasks)
+            await self._gather_bounded(tasks)
 
     # Legacy method kept but unused to ensure clean API
     async def _connect_all_enabled(self):
@@ -222,7 +268,20 @@ class MCPManager:
                 tasks.append(self._connect_single(name, config))
         
         if tasks:
-            await asyncio.gather(*tasks)
+            await self._gather_bounded(tasks)
+
+    async def _gather_bounded(self, coros: List[Any]) -> List[Any]:
+        """
+        Run connection coroutines concurrently, but cap how many run at once.
+        Each connect may spawn a subprocess (npx/uvx), so an unbounded fan-out
+        for a user with many servers can exhaust CPU and file descriptors.
+        The semaphore is shared, so overlapping fan-outs share one cap.
+        """
+        async def _run(coro):
+            async with self._connect_sem:
+                return await coro
+
+        return await asyncio.gather(*(_run(c) for c in coros), return_exceptions=True)
 
     async def _connect_single(self, name: str, config: Dict[str, Any]):
         """Connect a single server using mcp-use."""
@@ -260,14 +319,14 @@ class MCPManager:
                      creds = await oauth_service.get_full_credentials(self.user_id, app.id)
                      if creds and creds.get("token"):
                         resolved_config["auth"] = creds["token"]
-                        logger.debug(f"Refreshed and injected direct OAuth token for {name}")
+                        logger.debug("Refreshed and injected direct OAuth token for %s", name)
 
             # ------------------------------------------------------------------
             # Home/Env Spoofing
             # Only required for apps that use file-based credentials
             # ------------------------------------------------------------------
             if app and app.oauth_config and app.oauth_config.credential_files:
-                temp_home = PROJECT_ROOT / "backend" / "temp" / "tokens" / str(self.user_id) / name
+                temp_home = self._tokens_dir / name
                 temp_home.mkdir(parents=True, exist_ok=True)
                 
                 if "env" not in resolved_config:
@@ -278,29 +337,30 @@ class MCPManager:
                 resolved_config["env"]["USERPROFILE"] = str(temp_home.absolute())
 
             # mcp-use: Register then Connect
-            # Sanitize config for logging
-            log_config = resolved_config.copy()
-            if "auth" in log_config:
-                log_config["auth"] = "***"
-
-            logger.info(f"Adding server to mcp-use: {name} with config: {json.dumps(log_config, default=str)}")
+            # Sanitize and serialize config only when INFO is actually emitted
+            if logger.isEnabledFor(logging.INFO):
+                log_config = resolved_config.copy()
+                if "auth" in log_config:
+                    log_config["auth"] = "***"
+                logger.info("Adding server to mcp-use: %s with config: %s", name, json.dumps(log_config, default=str))
             self._client.add_server(name, resolved_config)
             
-            logger.info(f"Creating session for {name}...")
+            logger.info("Creating session for %s...", name)
             self._sessions[name] = await self._client.create_session(name)
+            self._tools_cache.pop(name, None)
             
             # Post-connect cleanup of temp files
             if app and app.oauth_config and app.oauth_config.credential_files:
                  self._cleanup_temp_files(app, name)
             
-            logger.info(f"✅ Connected: {name}")
+            logger.info("✅ Connected: %s", name)
         except Exception as e:
             error_str = str(e).lower()
             is_auth_error = "401" in error_str or "unauthorized" in error_str or "oauthauthenticationerror" in type(e).__name__.lower()
             
             if is_auth_error:
                 # Auth failure - delete stale token to force re-authentication on next attempt
-                logger.warning(f"🔐 Authentication failed for {name}. Deleting stale token to trigger re-auth.")
+                logger.warning("🔐 Authentication failed for %s. Deleting stale token to trigger re-auth.", name)
                 try:
                     from backend.app.core.oauth.service import oauth_service
                     from backend.app.db import AsyncSessionLocal
@@ -315,11 +375,12 @@ class MCPManager:
                             )
                         )
                         await session.commit()
-                    logger.info(f"🗑️ Deleted stale token for {name}. User must re-authenticate.")
+                    oauth_service.invalidate_token_cache(self.user_id, name)
+                    logger.info("🗑️ Deleted stale token for %s. User must re-authenticate.", name)
                 except Exception as cleanup_error:
-                    logger.error(f"Failed to cleanup stale token: {cleanup_error}")
+                    logger.error("Failed to cleanup stale token: %s", cleanup_error)
                     
-            logger.error(f"❌ Connection failed for {name}: {e}")
+            logger.error("❌ Connection failed for %s: %s", name, e)
             import traceback
             logger.error(traceback.format_exc())
 
@@ -330,11 +391,11 @@ class MCPManager:
         # 1. Fetch credentials using app.id for per-app token storage
         creds = await oauth_service.get_full_credentials(self.user_id, app.id)
         if not creds:
-            logger.warning(f"No OAuth credentials found for app {app.id}")
+            logger.warning("No OAuth credentials found for app %s", app.id)
             return
 
         # 2. Prepare Directory: Isolated by server_name
-        base_dir = PROJECT_ROOT / "backend" / "temp" / "tokens" / str(self.user_id) / server_name
+        base_dir = self._tokens_dir / server_name
         base_dir.mkdir(parents=True, exist_ok=True)
 
         # 3. Process File Definitions
@@ -375,7 +436,7 @@ class MCPManager:
             with open(file_path, "w") as f:
                 json.dump(content, f, indent=2)
             
-            logger.info(f"Generated temp credential file for {server_name} ({app.id}): {file_path}")
+            logger.info("Generated temp credential file for %s (%s): %s", server_name, app.id, file_path)
 
             # 4. Inject into Config
             if "env" not in resolved_config:
@@ -391,6 +452,7 @@ class MCPManager:
 
     async def disconnect_server(self, name: str):
         """Disconnect active session."""
+        self._tools_cache.pop(name, None)
         if name in self._sessions:
             self._sessions.pop(name, None)
             
@@ -407,10 +469,10 @@ class MCPManager:
                 return
 
             # Completely remove the isolated server directory
-            base_dir = PROJECT_ROOT / "backend" / "temp" / "tokens" / str(self.user_id) / server_name
+            base_dir = self._tokens_dir / server_name
             if base_dir.exists():
                 # shutil.rmtree(base_dir, ignore_errors=True)
-                logger.info(f"Skipped cleanup of isolated temp directory for {server_name}: {base_dir}")
+                logger.info("Skipped cleanup of isolated temp directory for %s: %s", server_name, base_dir)
             
             # Optional: remove user directory if empty
             user_dir = base_dir.parent
@@ -420,7 +482,7 @@ class MCPManager:
                 except:
                     pass
         except Exception as e:
-            logger.warning(f"Failed to cleanup temp files for {server_name}: {e}")
+            logger.warning("Failed to cleanup temp files for %s: %s", server_name, e)
 
     async def restart_server(self, name: str):
         """Restart a specific server connection."""
@@ -437,110 +499,111 @@ class MCPManager:
         """Get LangChain-ready tools from connected servers (optionally filtered)."""
         all_tools = []
         
-        # Ensure target servers are connected
+        # Ensure target servers are connected (concurrently, bounded)
         targets = server_names if server_names else list(self._server_configs.keys())
+        pending = []
         for name in targets:
             config = self._server_configs.get(name)
             if config and config.get("enabled", True) and name not in self._sessions:
-                try:
-                    await self._connect_single(name, config)
-                except Exception as e:
-                    logger.error(f"Failed to connect to {name} during get_tools: {e}")
+                pending.append(self._connect_single(name, config))
+        if pending:
+            await self._gather_bounded(pending)
+
+        # If explicit list provided, skip others
+        selected = [
+            (name, session) for name, session in self._sessions.items()
+            if not server_names or name in server_names
+        ]
+        # Use standard adapter logic, fetching from all sessions concurrently
+        results = await asyncio.gather(
+            *(self._fetch_tools_from_session(name, session) for name, session in selected),
+            return_exceptions=True
+        )
 
-        for name, session in self._sessions.items():
-            # If explicit list provided, skip others
-            if server_names and name not in server_names:
+        for (name, _), tools in zip(selected, results):
+            if isinstance(tools, BaseException):
+                logger.error("Error fetching tools for %s: %s", name, tools)
                 continue
 
-            config = self._server_configs.get(name, {})
-            disabled_tools = config.get("disabled_tools", [])
+            config = self._server_configs.get(name, _EMPTY_CONFIG)
+            disabled_tools = frozenset(config.get("disabled_tools") or ())
             
-            try:
-                # Use standard adapter logic
-                tools = await self._fetch_tools_from_session(name, session)
+            for tool in tools:
+                if tool.name in disabled_tools:
+                    continue
                 
-                for tool in tools:
-                    if tool.name in disabled_tools:
-                        continue
-                    
-                    # Wrap tool execution for self-healing auth and type safety
-                    tool = self._wrap_tool_execution(tool, name)
-                    all_tools.append(tool)
-                    
-            except Exception as e:
-                logger.error(f"Error fetching tools for {name}: {e}")
+                # Wrap tool execution for self-healing auth and type safety
+                tool = self._wrap_tool_execution(tool, name)
+                all_tools.append(tool)
                 
         return all_tools
 
     async def _fetch_tools_from_session(self, name: str, session: Any) -> List[StructuredTool]:
         """Convert mcp-use session to LangChain tools."""
         
-        # Simple adapter to make mcp-use session look like official python-sdk session
-        # This allows load_mcp_tools to work
-        class SimpleAdapter:
-            def __init__(self, s): self.s = s
-            async def list_tools(self, cursor=None): 
-                # Robustly extract tools list
-                res = await self.s.list_tools()
-                tools_list = getattr(res, 'tools', res)
-                if not isinstance(tools_list, list):
-                    logger.warning(f"SimpleAdapter: list_tools for {name} returned non-list tools: {type(tools_list)}")
-                    tools_list = []
-                
-                # Wrap list in object expected by load_mcp_tools adapter
-                class Result: 
-                    def __init__(self, t): self.tools = t; self.nextCursor = None
-                return Result(tools_list)
-            async def call_tool(self, name, arguments, **kwargs):
-                return await self.s.call_tool(name, arguments)
+        return await load_mcp_tools(_SessionAdapter(name, session, self._list_raw_tools))
+
+    async def _list_raw_tools(self, name: str, session: Any) -> List[Any]:
+        """
+        List raw MCP tool definitions for a session, reusing a recent result.
+        Tool lists only change on (re)connect, which invalidates the cache.
+        """
+        cached = self._tools_cache.get(name)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
 
-        return await load_mcp_tools(SimpleAdapter(session))
+        # Robust handle: result might be a list or an object with .tools
+        result = await session.list_tools()
+        tools_list = getattr(result, 'tools', result)
+        if not isinstance(tools_list, list):
+            logger.warning("Unexpected tools format from %s: %s", name, type(tools_list))
+            tools_list = []
+
+        self._tools_cache[name] = (time.monotonic() + TOOLS_CACHE_TTL_SECONDS, tools_list)
+        return tools_list
 
     # --------------------------------------------------------------------------
     # 4. Status & management methods (for API)
     # --------------------------------------------------------------------------
 
-    def _matches_pattern(self, name: str, patterns: List[str]) -> bool:
-        for p in patterns:
-            if fnmatch.fnmatch(name, p): return True
-        return False
-
     async def get_all_tools_status(self) -> Dict[str, Any]:
         """Get flattened status of all tools for UI."""
         status = {}
         
-        sensitive_patterns = self._hitl_config.get("sensitive_tools", [])
+        # Fused, cached regex for the user's HITL glob patterns
+        hitl_regex = compile_tool_patterns(self._hitl_config.get("sensitive_tools", []))
+        
+        # List tools of all connected servers concurrently
+        connected_names = [name for name in self._server_configs if name in self._sessions]
+        listings = await asyncio.gather(
+            *(self._list_raw_tools(name, self._sessions[name]) for name in connected_names),
+            return_exceptions=True
+        )
+        raw_by_server = dict(zip(connected_names, listings))
         
         for name, config in self._server_configs.items():
             is_enabled = config.get("enabled", True)
-            connected = name in self._sessions
+            connected = name in raw_by_server
             
             server_tools = []
+            raw_tools = raw_by_server.get(name)
             
-            try:
-                if connected:
-                    result = await self._sessions[name].list_tools()
-                    # Robust handle: result might be a list or an object with .tools
-                    if hasattr(result, 'tools'):
-                        raw_tools = result.tools
-                    elif isinstance(result, list):
-                        raw_tools = result
-                    else:
-                        logger.warning(f"Unexpected tools format from {name}: {type(result)}")
-                        raw_tools = []
-
-                    for t in raw_tools:
-                        is_disabled = t.name in config.get("disabled_tools", [])
-                        is_hitl = self._matches_pattern(t.name, sensitive_patterns)
-                        
-                        server_tools.append({
-                            "name": t.name,
-                            "description": t.description,
-                            "enabled": not is_disabled,
-                            "hitl": is_hitl
-                        })
-            except Exception as e:
-                logger.error(f"Failed to list tools for status {name}: {e}")
+            if isinstance(raw_tools, BaseException):
+                logger.error("Failed to list tools for status %s: %s", name, raw_tools)
+            elif raw_tools:
+                disabled_tools = frozenset(config.get("disabled_tools") or ())
+                for t in raw_tools:
+                    is_disabled = t.name in disabled_tools
+                    is_hitl = hitl_regex is not None and hitl_regex.match(t.name) is not None
+                    
+                    server_tools.append({
+                        "name": t.name,
+                        "description": t.description,
+                        "enabled": not is_disabled,
+                        "hitl": is_hitl,
+                        # JSON schema published by the MCP server itself
+                        "input_schema": getattr(t, "inputSchema", None)
+                    })
 
             status[name] = {
                 "connected": connected,
@@ -555,7 +618,8 @@ class MCPManager:
             raise ValueError(f"Server {server_name} not found")
             
         config = self._server_configs[server_name]
-        disabled = config.get("disabled_tools", [])
+        # Work on a copy so the cache only changes once the DB row is updated
+        disabled = list(config.get("disabled_tools", []))
         
         if not enabled:
             if tool_name not in disabled:
@@ -566,13 +630,14 @@ class MCPManager:
                 
         # Update DB
         async with AsyncSession(async_engine) as session:
-            stmt = select(MCPServerConfig).where(
+            stmt = update(MCPServerConfig).where(
                 MCPServerConfig.user_id == self.user_id,
                 MCPServerConfig.name == server_name
-            )
-            row = (await session.execute(stmt)).scalar_one()
-            row.disabled_tools = list(disabled) # Force update
+            ).values(disabled_tools=disabled)
+            result = await session.execute(stmt)
             await session.commit()
+            if not result.rowcount:
+                raise ValueError(f"Server {server_name} not found")
             
         # Update cache
         config["disabled_tools"] = disabled
@@ -640,7 +705,7 @@ class MCPManager:
                 is_auth_error = "401" in error_msg or "unauthorized" in error_msg or "authentication failed" in error_msg
                 
                 if is_auth_error:
-                    logger.warning(f"🔄 Token expired for {server_name} during tool '{tool.name}'. Triggering self-healing refresh...")
+                    logger.warning("🔄 Token expired for %s during tool '%s'. Triggering self-healing refresh...", server_name, tool.name)
                     
                     try:
                         # 1. Force Restart (Disconnect -> Reconnect)
@@ -650,7 +715,7 @@ class MCPManager:
                         # 2. We need to get the tool function from the NEW session
                         # We can't just call original_func because it's bound to the OLD session/client
                         
-                        logger.info(f"🔄 verifying new session for {server_name}...")
+                        logger.info("🔄 verifying new session for %s...", server_name)
                         new_session = self._sessions.get(server_name)
                         if not new_session:
                              raise ValueError("Failed to re-establish session after restart")
@@ -664,12 +729,12 @@ class MCPManager:
                              raise ValueError(f"Tool {tool.name} not found after restart")
                              
                         # 4. Retry Execution with new callable
-                        logger.info(f"🔄 Retrying {tool.name} with refreshed token...")
+                        logger.info("🔄 Retrying %s with refreshed token...", tool.name)
                         result = await new_tool.coroutine(**kwargs)
                         
                     except Exception as retry_error:
                         # If retry fails, return original error or retry error
-                        logger.error(f"❌ Self-healing failed for {server_name}: {retry_error}")
+                        logger.error("❌ Self-healing failed for %s: %s", server_name, retry_error)
                         raise e # Raise the ORIGINAL error to show the auth failure to user if repair failed
                 else:
                     # Not an auth error, just raise normally
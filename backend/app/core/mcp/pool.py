@@ -7,11 +7,20 @@ Simplified signature (removed HITL/Conversation params).
 import asyncio
 import time
 import logging
+from dataclasses import dataclass
 from typing import Dict, Any, Optional
 from backend.app.core.mcp.manager import MCPManager
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass(slots=True)
+class _PoolEntry:
+    """A pooled manager and the last time it was handed out (monotonic clock)."""
+    manager: MCPManager
+    last_accessed: float
+
+
 class MCPConnectionPool:
     """
     Singleton connection pool for MCP Managers.
@@ -29,8 +38,10 @@ class MCPConnectionPool:
         if self.initialized:
             return
         
-        # Map user_id -> { "manager": MCPManager, "last_accessed": float }
-        self._active_managers: Dict[str, Dict[str, Any]] = {}
+        # Map user_id -> _PoolEntry(manager, last_accessed)
+        self._active_managers: Dict[str, _PoolEntry] = {}
+        # Map user_id -> in-flight creation task (single-flight per user)
+        self._pending: Dict[str, asyncio.Task] = {}
         self.IDLE_TIMEOUT_SECONDS = 300  # 5 minutes
         self.initialized = True
         logger.info("MCP Connection Pool initialized")
@@ -40,35 +51,40 @@ class MCPConnectionPool:
         Get existing manager for user or create new one.
         """
         user_key = str(user_id)
-        current_time = time.time()
         
-        if user_key in self._active_managers:
-            entry = self._active_managers[user_key]
-            entry["last_accessed"] = current_time
+        entry = self._active_managers.get(user_key)
+        if entry is not None:
+            entry.last_accessed = time.monotonic()
             # logger.debug(f"Retrieved pool manager for {user_id}")
-            return entry["manager"]
+            return entry.manager
             
-        # Create new manager
-        logger.info(f"Creating new MCP Manager for pool (User: {user_id})")
+        # Concurrent first requests for the same user share one creation
+        task = self._pending.get(user_key)
+        if task is None:
+            task = asyncio.create_task(self._create_manager(user_id, user_key))
+            self._pending[user_key] = task
+            task.add_done_callback(lambda _t: self._pending.pop(user_key, None))
+        return await asyncio.shield(task)
+
+    async def _create_manager(self, user_id: Any, user_key: str) -> MCPManager:
+        """Create, initialize and register a manager for a user."""
+        logger.info("Creating new MCP Manager for pool (User: %s)", user_id)
         manager = MCPManager(user_id)
         await manager.initialize()
         
-        self._active_managers[user_key] = {
-            "manager": manager,
-            "last_accessed": current_time
-        }
+        self._active_managers[user_key] = _PoolEntry(manager, time.monotonic())
         return manager
 
     async def cleanup_idle_managers(self):
-        current_time = time.time()
+        current_time = time.monotonic()
         users_to_remove = []
         
         for user_id, entry in self._active_managers.items():
-            if current_time - entry["last_accessed"] > self.IDLE_TIMEOUT_SECONDS:
+            if current_time - entry.last_accessed > self.IDLE_TIMEOUT_SECONDS:
                 users_to_remove.append(user_id)
         
         for user_id in users_to_remove:
-            logger.info(f"Cleaning up idle MCP Manager for user {user_id}")
+            logger.info("Cleaning up idle MCP Manager for user %s", user_id)
             entry = self._active_managers.pop(user_id)
             try:
                 # Disconnect active sessions (fire and forget cleanup)
@@ -79,7 +95,7 @@ class MCPConnectionPool:
                 # We'll explicitly close if client exposed close.
                 pass 
             except Exception as e:
-                logger.error(f"Error cleaning manager: {e}")
+                logger.error("Error cleaning manager: %s", e)
 
     async def start_cleanup_loop(self):
         logger.info("Starting MCP cleanup loop")
@@ -90,7 +106,7 @@ class MCPConnectionPool:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Error in cleanup loop: {e}")
+                logger.error("Error in cleanup loop: %s", e)
 
     async def shutdown(self):
         logger.info("Shutting down MCP Connection Pool...")
@@ -667,35 +667,46 @@ SPHERE_REGISTRY: List[SphereApp] = [
     )
 ]
 
-def get_app_by_id(app_id: str) -> Optional[SphereApp]:
+def _build_lookups():
+    """
+    Index the static registry once (first match wins, as in a linear scan).
+    Returns (apps_by_id, oauth_config_by_provider, primary_app_by_provider).
+    """
+    apps_by_id: Dict[str, SphereApp] = {}
+    oauth_by_provider: Dict[str, OAuthConfig] = {}
+    primary_by_provider: Dict[str, str] = {}
+    
     for app in SPHERE_REGISTRY:
-        if app.id == app_id:
-            return app
-    return None
+        apps_by_id.setdefault(app.id, app)
+        if app.oauth_config:
+            provider = app.oauth_config.provider_name
+            oauth_by_provider.setdefault(provider, app.oauth_config)
+            # First look for an app marked as primary
+            if app.is_primary:
+                primary_by_provider.setdefault(provider, app.id)
+    
+    # Fallback to any app with this provider
+    for app in SPHERE_REGISTRY:
+        if app.oauth_config:
+            primary_by_provider.setdefault(app.oauth_config.provider_name, app.id)
+    
+    return apps_by_id, oauth_by_provider, primary_by_provider
+
+_APPS_BY_ID, _OAUTH_CONFIG_BY_PROVIDER, _PRIMARY_APP_BY_PROVIDER = _build_lookups()
+
+def get_app_by_id(app_id: str) -> Optional[SphereApp]:
+    return _APPS_BY_ID.get(app_id)
 
 def get_all_apps() -> List[SphereApp]:
     return SPHERE_REGISTRY
 
 def get_primary_app_for_provider(provider_name: str) -> Optional[str]:
-    """Find the default app ID for a given OAuth provider."""
-    # First look for an app marked as primary
-    for app in SPHERE_REGISTRY:
-        if app.is_primary and app.oauth_config and app.oauth_config.provider_name == provider_name:
-            return app.id
-    
-    # Fallback to any app with this provider
-    for app in SPHERE_REGISTRY:
-        if app.oauth_config and app.oauth_config.provider_name == provider_name:
-            return app.id
-            
-    return None
+    """Find the default app ID for a given OAuth provider (primary app first)."""
+    return _PRIMARY_APP_BY_PROVIDER.get(provider_name)
 
 def get_oauth_config_by_provider(provider_name: str) -> Optional[OAuthConfig]:
     """
     Look up OAuth provider config from the registry.
     This replaces the old `core.oauth.registry.get_provider`.
     """
-    for app in SPHERE_REGISTRY:
-        if app.oauth_config and app.oauth_config.provider_name == provider_name:
-            return app.oauth_config
-    return None
\ No newline at end of file
+    return _OAUTH_CONFIG_BY_PROVIDER.get(provider_name)
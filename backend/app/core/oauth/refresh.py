@@ -27,14 +27,14 @@ async def refresh_tokens_task():
         result = await session.execute(stmt)
         expiring_tokens = result.scalars().all()
         
-        logger.info(f"Found {len(expiring_tokens)} tokens to refresh")
+        logger.info("Found %s tokens to refresh", len(expiring_tokens))
         
         for token in expiring_tokens:
             try:
-                logger.info(f"Refreshing token for user {token.user_id} provider {token.provider}")
+                logger.info("Refreshing token for user %s provider %s", token.user_id, token.provider)
                 await oauth_service.refresh_token(token, session)
             except Exception as e:
-                logger.error(f"Failed to refresh token {token.id}: {e}")
+                logger.error("Failed to refresh token %s: %s", token.id, e)
                 
     logger.info("Token refresh task completed")
 
@@ -44,5 +44,5 @@ async def start_refresh_loop_forever():
         try:
             await refresh_tokens_task()
         except Exception as e:
-            logger.error(f"Error in refresh loop: {e}")
+            logger.error("Error in refresh loop: %s", e)
         await asyncio.sleep(600) # 10 minutes
@@ -1,6 +1,8 @@
+import asyncio
 import logging
 import json
 import secrets
+import time
 from typing import Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta, timezone
 
@@ -20,8 +22,149 @@ logger = logging.getLogger(__name__)
 # Structure: { "state_string": { "verifier": "...", "provider": "...", "user_id": "...", "redirect_url": "..." } }
 AUTH_CACHE: Dict[str, Dict[str, str]] = {}
 
+
+def _http2_available() -> bool:
+    """HTTP/2 is opt-in and only used when the `h2` package is installed."""
+    if not config.HTTP2_ENABLED:
+        return False
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        logger.warning("HTTP2_ENABLED is set but 'h2' is not installed. Falling back to HTTP/1.1")
+        return False
+
+
+_USE_HTTP2 = _http2_available()
+
+
+# Pool sizing for the shared outbound client
+HTTP_LIMITS = httpx.Limits(
+    max_connections=config.HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+)
+
+
+# Sent on every request: all token/discovery/DCR endpoints answer in JSON
+# (some, e.g. GitHub, fall back to form-encoding without an explicit Accept)
+HTTP_DEFAULT_HEADERS = httpx.Headers({
+    "Accept": "application/json",
+    "User-Agent": f"{config.APP_NAME}/{config.APP_VERSION}",
+})
+
+
+def _http_client(**kwargs) -> httpx.AsyncClient:
+    """Create an outbound HTTP client, multiplexing over HTTP/2 when enabled."""
+    return httpx.AsyncClient(http2=_USE_HTTP2, limits=HTTP_LIMITS, headers=HTTP_DEFAULT_HEADERS, **kwargs)
+
+
+# Default timeout for all OAuth / discovery requests
+HTTP_TIMEOUT_SECONDS = 30.0
+
+# Retry policy for transient provider failures (rate limits, unavailability).
+# Only failures where the provider did not process the request are retried,
+# so single-use authorization codes are never replayed after being consumed.
+HTTP_MAX_ATTEMPTS = 3
+HTTP_BACKOFF_BASE_SECONDS = 0.5
+HTTP_BACKOFF_MAX_SECONDS = 10.0
+RETRYABLE_STATUS_CODES = frozenset({429, 503})
+
+
+def _retry_delay(resp: Optional[httpx.Response], attempt: int) -> float:
+    """Honour a numeric Retry-After header, else exponential backoff."""
+    if resp is not None:
+        retry_after = resp.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), HTTP_BACKOFF_MAX_SECONDS)
+    return min(HTTP_BACKOFF_BASE_SECONDS * (2 ** attempt), HTTP_BACKOFF_MAX_SECONDS)
+
+
+# Lifetime assumed for refreshed tokens when the provider omits expires_in
+DEFAULT_TOKEN_LIFETIME_SECONDS = 3600
+
+
+def _expires_at(expires_in: Any) -> datetime:
+    """Absolute UTC expiry for a relative ``expires_in`` (seconds) value."""
+    return datetime.now(timezone.utc) + timedelta(seconds=int(expires_in))
+
+
+# (static attribute, env-var attribute, dynamic key in token.raw) per client credential
+_CLIENT_CREDENTIAL_FIELDS = (
+    ("client_id", "client_id_env", "_client_id"),
+    ("client_secret", "client_secret_env", "_client_secret"),
+)
+
+
+def _resolve_client_credentials(provider_config: Any, raw: Optional[Dict[str, Any]]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Resolve (client_id, client_secret) for a provider.
+    Dynamic credentials stored in token.raw win over static/env configuration.
+    """
+    raw = raw or {}
+    resolved = []
+    for attr, env_attr, raw_key in _CLIENT_CREDENTIAL_FIELDS:
+        if raw_key in raw:
+            value = raw[raw_key]
+        else:
+            value = getattr(provider_config, attr)
+            if not value and (env_name := getattr(provider_config, env_attr)):
+                value = getattr(config, env_name, None)
+        resolved.append(value)
+    client_id, client_secret = resolved
+    return client_id, client_secret
+
+
+# Short-lived cache for raw token metadata (used when building MCP configs)
+TOKEN_METADATA_TTL_SECONDS = 30
+
+
 class OAuthService:
 
+    def __init__(self):
+        # Structure: { (user_id, app_id): (expires_at_monotonic, raw_metadata) }
+        self._token_metadata_cache: Dict[Tuple[str, str], Tuple[float, Optional[Dict[str, Any]]]] = {}
+        # Shared client so token refreshes reuse pooled keep-alive connections
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get (or lazily create) the shared outbound HTTP client."""
+        if self._client is None or self._client.is_closed:
+            self._client = _http_client(timeout=HTTP_TIMEOUT_SECONDS)
+        return self._client
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request on the shared client, retrying transient failures
+        (429/503 and connection errors) with backoff.
+        """
+        client = self._get_client()
+        for attempt in range(HTTP_MAX_ATTEMPTS):
+            last_attempt = attempt == HTTP_MAX_ATTEMPTS - 1
+            try:
+                resp = await client.request(method, url, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                if last_attempt:
+                    raise
+                delay = _retry_delay(None, attempt)
+                logger.warning("%s %s failed to connect (%s). Retrying in %.1fs", method, url, e, delay)
+            else:
+                if resp.status_code not in RETRYABLE_STATUS_CODES or last_attempt:
+                    return resp
+                delay = _retry_delay(resp, attempt)
+                logger.warning("%s %s returned %s. Retrying in %.1fs", method, url, resp.status_code, delay)
+            await asyncio.sleep(delay)
+
+    async def aclose(self):
+        """Close the shared HTTP client. Called on app shutdown."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def invalidate_token_cache(self, user_id: Any, app_id: Optional[str]):
+        """Drop cached token metadata after a token is saved, refreshed or deleted."""
+        if app_id:
+            self._token_metadata_cache.pop((str(user_id), app_id), None)
+
     async def start_auth(self, app_id: str, user_id: str, redirect_url_frontend: str, target_app: Optional[str] = None) -> str:
         """
         Generates the authorization URL.
@@ -40,7 +183,7 @@ class OAuthService:
             app = get_app_by_id(target_app)
             if app and app.oauth_config:
                 oauth_config = app.oauth_config
-                logger.info(f"Using OAuth config from target app '{target_app}' with scopes: {oauth_config.scopes}")
+                logger.info("Using OAuth config from target app '%s' with scopes: %s", target_app, oauth_config.scopes)
                 
         # If no target_app or not found, try app_id
         if not oauth_config:
@@ -48,7 +191,7 @@ class OAuthService:
             if app and app.oauth_config:
                 final_target_app = app_id
                 oauth_config = app.oauth_config
-                logger.info(f"Using OAuth config from app_id '{app_id}' with scopes: {oauth_config.scopes}")
+                logger.info("Using OAuth config from app_id '%s' with scopes: %s", app_id, oauth_config.scopes)
         
         # 2. Fallback to generic provider lookup
         provider_name = app_id # Default assumption
@@ -71,7 +214,7 @@ class OAuthService:
 
         # Dynamic Auth Delegation: If we have discovery URL but no static credentials, go dynamic
         if getattr(oauth_config, "discovery_url", None) and not static_client_id:
-            logger.info(f"Delegating to Dynamic Auth for {provider_name} (No static creds, found discovery URL)")
+            logger.info("Delegating to Dynamic Auth for %s (No static creds, found discovery URL)", provider_name)
             return await self.start_dynamic_auth(user_id, oauth_config.discovery_url, redirect_url_frontend, target_app)
 
         client_id = static_client_id
@@ -166,10 +309,9 @@ class OAuthService:
             data["code_verifier"] = verifier
 
         # Execute Exchange
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(provider.token_url, data=data, headers={"Accept": "application/json"})
-            resp.raise_for_status()
-            token_data = resp.json()
+        resp = await self._request("POST", provider.token_url, data=data)
+        resp.raise_for_status()
+        token_data = resp.json()
 
         # Save to DB - use target_app as app_id for per-app token storage
         await self._save_token(user_id, provider_name, token_data, app_id=target_app)
@@ -193,9 +335,9 @@ class OAuthService:
         expires_in = data.get("expires_in")
         expires_at = None
         if refresh_token and expires_in is not None:
-            expires_at = datetime.now(timezone.utc) + timedelta(seconds=int(expires_in))
+            expires_at = _expires_at(expires_in)
         elif not refresh_token and expires_in is not None:
-            logger.info(f"No refresh_token for {provider} - treating as persistent (ignoring expires_in: {expires_in}s)")
+            logger.info("No refresh_token for %s - treating as persistent (ignoring expires_in: %ss)", provider, expires_in)
 
         async with AsyncSessionLocal() as session:
             # Check existing by app_id (or provider if app_id not provided for backward compat)
@@ -238,7 +380,8 @@ class OAuthService:
                 session.add(new_token)
             
             await session.commit()
-            logger.info(f"Saved OAuth token for user {user_id}, app_id={app_id}, provider={provider}")
+            self.invalidate_token_cache(user_id, app_id)
+            logger.info("Saved OAuth token for user %s, app_id=%s, provider=%s", user_id, app_id, provider)
             
     async def get_valid_token(self, user_id: str, app_id: str) -> Optional[str]:
         """
@@ -255,10 +398,10 @@ class OAuthService:
                 return None
                 
             if token.is_expired:
-                logger.info(f"Token for {app_id} is EXPIRED (Now: {datetime.now(timezone.utc)}, Exp: {token.expires_at}). Refreshing...")
+                logger.info("Token for %s is EXPIRED (Now: %s, Exp: %s). Refreshing...", app_id, datetime.now(timezone.utc), token.expires_at)
                 return await self.refresh_token(token, session)
             
-            logger.info(f"Token for {app_id} is VALID (Now: {datetime.now(timezone.utc)}, Exp: {token.expires_at}). Using existing.")
+            logger.info("Token for %s is VALID (Now: %s, Exp: %s). Using existing.", app_id, datetime.now(timezone.utc), token.expires_at)
             return token.access_token
 
     async def get_full_credentials(self, user_id: str, app_id: str) -> Optional[Dict[str, Any]]:
@@ -281,30 +424,17 @@ class OAuthService:
             from backend.app.core.mcp.registry import get_app_by_id
             app = get_app_by_id(app_id)
             if not app or not app.oauth_config:
-                logger.warning(f"No OAuth config found for app {app_id}")
+                logger.warning("No OAuth config found for app %s", app_id)
                 return None
                 
-            client_id = app.oauth_config.client_id
-            if not client_id and app.oauth_config.client_id_env:
-                client_id = getattr(config, app.oauth_config.client_id_env, None)
-
-            client_secret = app.oauth_config.client_secret
-            if not client_secret and app.oauth_config.client_secret_env:
-                client_secret = getattr(config, app.oauth_config.client_secret_env, None)
-            
-            # Check for Dynamic Credentials in token.raw
-            if token.raw:
-                 # Standardize keys from dynamic exchange
-                 if "_client_id" in token.raw:
-                     client_id = token.raw["_client_id"]
-                 if "_client_secret" in token.raw:
-                     client_secret = token.raw["_client_secret"]
+            # Static/env credentials, overridden by dynamic ones in token.raw
+            client_id, client_secret = _resolve_client_credentials(app.oauth_config, token.raw)
             
             # Ensure valid token
             if token.is_expired:
                 res = await self.refresh_token(token, session)
                 if not res:
-                     logger.error(f"Failed to refresh expired token for {app_id}")
+                     logger.error("Failed to refresh expired token for %s", app_id)
                      return None
                 
             return {
@@ -320,7 +450,7 @@ class OAuthService:
     async def refresh_token(self, token: OAuthToken, session: AsyncSession) -> Optional[str]:
         """Refresh logic."""
         if not token.refresh_token:
-            logger.warning(f"No refresh token for {token.provider}")
+            logger.warning("No refresh token for %s", token.provider)
             return None
             
         # Try to resolve config by app_id first
@@ -334,23 +464,11 @@ class OAuthService:
         if not provider_config:
             provider_config = get_oauth_config_by_provider(token.provider)
             
-        client_id = provider_config.client_id
-        if not client_id and provider_config.client_id_env:
-            client_id = getattr(config, provider_config.client_id_env, None)
-            
-        client_secret = provider_config.client_secret
-        if not client_secret and provider_config.client_secret_env:
-            client_secret = getattr(config, provider_config.client_secret_env, None)
-        
-        # Check for Dynamic Credentials in token.raw (e.g. for Atlassian/Zoho)
+        # Dynamic credentials in token.raw win (e.g. for Atlassian/Zoho)
+        client_id, client_secret = _resolve_client_credentials(provider_config, token.raw)
         token_url = provider_config.token_url
-        if token.raw:
-             if "_client_id" in token.raw:
-                 client_id = token.raw["_client_id"]
-             if "_client_secret" in token.raw:
-                 client_secret = token.raw["_client_secret"]
-             if "_token_url" in token.raw:
-                 token_url = token.raw["_token_url"]
+        if token.raw and "_token_url" in token.raw:
+            token_url = token.raw["_token_url"]
         
         data = {
             "grant_type": "refresh_token",
@@ -369,21 +487,15 @@ class OAuthService:
             data["client_secret"] = client_secret
         
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(token_url, data=data)
-                resp.raise_for_status()
-                new_data = resp.json()
-                
+            resp = await self._request("POST", token_url, data=data)
+            resp.raise_for_status()
+            new_data = resp.json()
+            
             token.access_token = new_data["access_token"]
             
             # Update expiry if provided, default to 1 hour for refreshed tokens if missing
-            new_expires_in = new_data.get("expires_in")
-            if new_expires_in:
-                 token.expires_at = datetime.now(timezone.utc) + timedelta(seconds=int(new_expires_in))
-            else:
-                 # If no expiry returned on refresh, assume 1 hour to force subsequent checks 
-                 # or keep as is? Standard says it should be there. Default 3600 is safe.
-                 token.expires_at = datetime.now(timezone.utc) + timedelta(seconds=3600)
+            # (standard says it should be there; 1 hour forces subsequent checks)
+            token.expires_at = _expires_at(new_data.get("expires_in") or DEFAULT_TOKEN_LIFETIME_SECONDS)
             if "refresh_token" in new_data:
                 token.refresh_token = new_data["refresh_token"]
             
@@ -393,10 +505,11 @@ class OAuthService:
             token.raw = merged_raw
             
             await session.commit()
+            self.invalidate_token_cache(token.user_id, token.app_id)
             return token.access_token
             
         except Exception as e:
-            logger.error(f"Failed to refresh token: {e}")
+            logger.error("Failed to refresh token: %s", e)
             return None
 
     # -------------------------------------------------------------------------
@@ -413,30 +526,29 @@ class OAuthService:
         parsed = urlparse(server_url)
         base_url = f"{parsed.scheme}://{parsed.netloc}"
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Try OAuth metadata discovery first
-            well_known_url = f"{base_url}/.well-known/oauth-authorization-server"
-            try:
-                logger.info(f"Discovering OAuth metadata from: {well_known_url}")
-                resp = await client.get(well_known_url)
-                resp.raise_for_status()
-                metadata = resp.json()
-                logger.info(f"OAuth metadata discovered successfully")
-                return metadata
-            except httpx.HTTPError as e:
-                logger.debug(f"OAuth discovery failed at {well_known_url}: {e}")
-            
-            # Try OIDC discovery
-            oidc_url = f"{base_url}/.well-known/openid-configuration"
-            try:
-                logger.info(f"Trying OIDC discovery at: {oidc_url}")
-                resp = await client.get(oidc_url)
-                resp.raise_for_status()
-                metadata = resp.json()
-                logger.info(f"OIDC metadata discovered successfully")
-                return metadata
-            except httpx.HTTPError as e:
-                logger.debug(f"OIDC discovery failed at {oidc_url}: {e}")
+        # Try OAuth metadata discovery first
+        well_known_url = f"{base_url}/.well-known/oauth-authorization-server"
+        try:
+            logger.info("Discovering OAuth metadata from: %s", well_known_url)
+            resp = await self._request("GET", well_known_url)
+            resp.raise_for_status()
+            metadata = resp.json()
+            logger.info("OAuth metadata discovered successfully")
+            return metadata
+        except httpx.HTTPError as e:
+            logger.debug("OAuth discovery failed at %s: %s", well_known_url, e)
+        
+        # Try OIDC discovery
+        oidc_url = f"{base_url}/.well-known/openid-configuration"
+        try:
+            logger.info("Trying OIDC discovery at: %s", oidc_url)
+            resp = await self._request("GET", oidc_url)
+            resp.raise_for_status()
+            metadata = resp.json()
+            logger.info("OIDC metadata discovered successfully")
+            return metadata
+        except httpx.HTTPError as e:
+            logger.debug("OIDC discovery failed at %s: %s", oidc_url, e)
         
         raise ValueError(
             f"Failed to discover OAuth metadata from {server_url}. "
@@ -465,32 +577,31 @@ class OAuthService:
         if scopes:
             registration_data["scope"] = " ".join(scopes)
         
-        logger.info(f"Attempting Dynamic Client Registration at: {registration_endpoint}")
+        logger.info("Attempting Dynamic Client Registration at: %s", registration_endpoint)
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                resp = await client.post(
-                    registration_endpoint,
-                    json=registration_data,
-                    headers={"Content-Type": "application/json"}
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                
-                client_id = data.get("client_id")
-                client_secret = data.get("client_secret")
-                
-                logger.info(f"DCR successful! Client ID: {client_id[:20]}...")
-                return client_id, client_secret
-                
-            except httpx.HTTPError as e:
-                logger.error(f"DCR failed: {e}")
-                if hasattr(e, 'response') and e.response:
-                    logger.error(f"DCR response: {e.response.text}")
-                raise ValueError(
-                    "Dynamic Client Registration failed. "
-                    "Server may not support DCR or requires manual client registration."
-                )
+        try:
+            resp = await self._request(
+                "POST",
+                registration_endpoint,
+                json=registration_data,
+            )
+            resp.raise_for_status()
+            data = resp.json()
+            
+            client_id = data.get("client_id")
+            client_secret = data.get("client_secret")
+            
+            logger.info("DCR successful! Client ID: %s...", client_id[:20])
+            return client_id, client_secret
+            
+        except httpx.HTTPError as e:
+            logger.error("DCR failed: %s", e)
+            if hasattr(e, 'response') and e.response:
+                logger.error("DCR response: %s", e.response.text)
+            raise ValueError(
+                "Dynamic Client Registration failed. "
+                "Server may not support DCR or requires manual client registration."
+            )
 
     async def start_dynamic_auth(
         self, 
@@ -518,7 +629,7 @@ class OAuthService:
         except ValueError as e:
             # Fallback: If discovery fails but we have a key, assume Manual Auth
             if has_key:
-                logger.info(f"OAuth discovery failed but found 'key' in URL. Falling back to Manual Auth for {server_url}")
+                logger.info("OAuth discovery failed but found 'key' in URL. Falling back to Manual Auth for %s", server_url)
                 
                 # Determine provider name generically
                 provider_name = "dynamic_oauth" # Default fallback
@@ -574,7 +685,7 @@ class OAuthService:
         if dcr_cache:
             client_id = dcr_cache.get("client_id")
             client_secret = dcr_cache.get("client_secret")
-            logger.info(f"Using cached DCR credentials for {server_url}")
+            logger.info("Using cached DCR credentials for %s", server_url)
         
         # If no cached credentials, try DCR
         if not client_id and registration_endpoint:
@@ -651,7 +762,7 @@ class OAuthService:
         # This is the OAuth 2.0 standard way to request a refresh token
         if scope_str and "offline_access" not in scope_str:
             scope_str = scope_str + " offline_access"
-            logger.info(f"Added 'offline_access' scope for refresh token support")
+            logger.info("Added 'offline_access' scope for refresh token support")
         
         # Store scope in cache for use during token exchange
         AUTH_CACHE[state]["scope"] = scope_str
@@ -662,7 +773,7 @@ class OAuthService:
         from urllib.parse import urlencode
         auth_url = f"{authorize_url}?{urlencode(params)}"
         
-        logger.info(f"Generated dynamic OAuth URL for {server_url}")
+        logger.info("Generated dynamic OAuth URL for %s", server_url)
         return auth_url
 
     async def exchange_code_dynamic(self, code: str, state: str) -> Tuple[str, str, str, Optional[str]]:
@@ -687,7 +798,7 @@ class OAuthService:
         
         # Handle BYPASS for manual auth
         if code == "BYPASS_MANUAL_AUTH" and cache_data.get("is_bypass"):
-            logger.info(f"Processing manual auth bypass for {server_url}")
+            logger.info("Processing manual auth bypass for %s", server_url)
             # Create a dummy token structure
             token_data = {
                 "access_token": "", # No token needed as key is in URL
@@ -726,23 +837,23 @@ class OAuthService:
         if scope:
             data["scope"] = scope
         
-        logger.info(f"Exchanging code for tokens at: {token_url}")
+        logger.info("Exchanging code for tokens at: %s", token_url)
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.post(
-                token_url, 
-                data=data, 
-                headers={"Accept": "application/json"}
-            )
-            resp.raise_for_status()
-            token_data = resp.json()
+        resp = await self._request(
+            "POST",
+            token_url, 
+            data=data,
+        )
+        resp.raise_for_status()
+        token_data = resp.json()
         
         # DEBUG: Log the actual response to see if refresh_token is present
-        logger.info(f"Token response keys: {list(token_data.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Token response keys: %s", list(token_data))
         if "refresh_token" in token_data:
-            logger.info(f"✅ Refresh token RECEIVED from {token_url}")
+            logger.info("✅ Refresh token RECEIVED from %s", token_url)
         else:
-            logger.warning(f"⚠️ NO refresh_token in response from {token_url}. Keys: {list(token_data.keys())}")
+            logger.warning("⚠️ NO refresh_token in response from %s. Keys: %s", token_url, list(token_data.keys()))
         
         # Store server_url in token metadata for later use
         token_data["_server_url"] = server_url
@@ -754,7 +865,7 @@ class OAuthService:
         provider_name = cache_data.get("provider", "dynamic_oauth")
         await self._save_token(user_id, provider_name, token_data, app_id=target_app)
         
-        logger.info(f"Dynamic OAuth successful for user {user_id}, app_id={target_app}")
+        logger.info("Dynamic OAuth successful for user %s, app_id=%s", user_id, target_app)
         return frontend_url, user_id, provider_name, target_app
 
     async def _save_dcr_credentials(self, server_url: str, client_id: str, client_secret: Optional[str]):
@@ -776,7 +887,7 @@ class OAuthService:
         }
         
         dcr_file.write_text(json.dumps(dcr_data))
-        logger.debug(f"Saved DCR credentials for {server_url}")
+        logger.debug("Saved DCR credentials for %s", server_url)
 
     async def _load_dcr_credentials(self, server_url: str) -> Optional[Dict[str, Any]]:
         """Load DCR credentials for a server URL if they exist."""
@@ -797,7 +908,15 @@ class OAuthService:
         return None
 
     async def get_token_metadata(self, user_id: str, app_id: str) -> Optional[Dict[str, Any]]:
-        """Get raw token metadata (including custom fields like _server_url) by app_id."""
+        """
+        Get raw token metadata (including custom fields like _server_url) by app_id.
+        Cached for TOKEN_METADATA_TTL_SECONDS since a single config build reads it repeatedly.
+        """
+        key = (str(user_id), app_id)
+        cached = self._token_metadata_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
         async with AsyncSessionLocal() as session:
             stmt = select(OAuthToken).where(
                 OAuthToken.user_id == user_id,
@@ -805,8 +924,8 @@ class OAuthService:
             )
             token = (await session.execute(stmt)).scalar_one_or_none()
             
-            if token:
-                return token.raw
-            return None
+            raw = token.raw if token else None
+            self._token_metadata_cache[key] = (time.monotonic() + TOKEN_METADATA_TTL_SECONDS, raw)
+            return raw
 
 oauth_service = OAuthService()
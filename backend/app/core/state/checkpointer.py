@@ -49,7 +49,7 @@ async def initialize_checkpointer():
         logger.info("✅ Checkpointer ready")
         
     except Exception as e:
-        logger.error(f"Failed to initialize checkpointer: {e}")
+        logger.error("Failed to initialize checkpointer: %s", e)
         # If we fail here, we might want to cleanup
         if _saver_context:
             await _saver_context.__aexit__(None, None, None)
@@ -189,7 +189,7 @@ async def load_history(
         return langchain_messages
         
     except Exception as e:
-        logger.error(f"⚠️ Error loading history for {thread_id}: {e}")
+        logger.error("⚠️ Error loading history for %s: %s", thread_id, e)
         return []
 
 
@@ -229,7 +229,7 @@ async def save_history(
             await save_message(conversation.id, role, msg.content)
         
         if new_messages:
-            logger.info(f"✅ Saved {len(new_messages)} new message(s) to database")
+            logger.info("✅ Saved %s new message(s) to database", len(new_messages))
             
             # Auto-name conversation if it's still "New Conversation"
             if conversation.title == "New Conversation" or not conversation.title:
@@ -245,5 +245,5 @@ async def save_history(
                     print(f"📝 Updated conversation title to: {new_title}")
             
     except Exception as e:
-        logger.error(f"⚠️ Error saving history for {thread_id}: {e}")
+        logger.error("⚠️ Error saving history for %s: %s", thread_id, e)
 
@@ -26,6 +26,7 @@ from backend.app.core.logging import setup_logging
 from backend.app.core.middleware import register_middlewares
 from backend.app.core.exceptions import register_exception_handlers
 from backend.app.core.mcp.pool import mcp_pool
+from backend.app.core.oauth.service import oauth_service
 from backend.app.core.state.checkpointer import initialize_checkpointer, shutdown_checkpointer
 import uvicorn
 
@@ -42,13 +43,12 @@ async def lifespan(app: FastAPI):
     Initializes resources on startup and cleans up on shutdown.
     """
     # Startup
-    logger.info(f"Starting {config.APP_NAME} v{config.APP_VERSION}")
+    logger.info("Starting %s v%s", config.APP_NAME, config.APP_VERSION)
 
-    # Init DB Tables
-    await init_db()
-
-    # Init Checkpointer
-    await initialize_checkpointer()
+    # Init DB Tables and Checkpointer (independent; first failure cancels the other)
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(init_db())
+        tg.create_task(initialize_checkpointer())
 
     # Start MCP Pool cleanup task
     cleanup_task = asyncio.create_task(mcp_pool.start_cleanup_loop())
@@ -66,6 +66,7 @@ async def lifespan(app: FastAPI):
         pass
 
     await mcp_pool.shutdown()
+    await oauth_service.aclose()
     await shutdown_checkpointer()
 
     logger.info("Shutting down application...")
@@ -4,6 +4,7 @@ Handles message processing, agent execution, and HITL integration.
 Simplified to use LangGraph checkpointer for pause/resume.
 """
 
+import asyncio
 import logging
 from typing import AsyncGenerator, Dict, Any, List, Optional
 from uuid import UUID
@@ -15,9 +16,21 @@ from backend.app.models.conversation import Conversation
 from backend.app.models.message import Message, MessageRole
 from backend.app.models.mcp_server import MCPServerConfig
 from backend.app.core.state.models import User
+from backend.app.core.agents.agent import AgentEvent
 
 logger = logging.getLogger(__name__)
 
+# Agent events forwarded to the client unchanged
+_PASSTHROUGH_EVENT_TYPES = frozenset({"tool_start", "tool_end", "error"})
+
+
+def _flatten_content(content: List[Any]) -> str:
+    """Join LangChain content blocks (str / {"text": ...} dicts) into plain text."""
+    return "".join([
+        c if isinstance(c, str) else c.get("text", "") if isinstance(c, dict) else str(c)
+        for c in content
+    ])
+
 
 class ChatService:
     """
@@ -33,7 +46,7 @@ class ChatService:
         self,
         conversation: Conversation,
         user_input: str,
-    ) -> AsyncGenerator[Dict[str, Any], None]:
+    ) -> AsyncGenerator[AgentEvent, None]:
         """
         Process a user message and yield streaming events.
         New architecture: uses checkpointer & agent middleware for HITL.
@@ -107,13 +120,6 @@ class ChatService:
             # Get simplified Manager
             mcp_manager = await mcp_pool.get_manager(self.user_id)
             
-            # Connect & Get Tools
-            # Only connect to the servers suggested by the planner
-            await mcp_manager.connect_servers(servers_to_use)
-            
-            # Get tools only from these servers
-            tools = await mcp_manager.get_tools(server_names=servers_to_use)
-            
             # --- PERSISTENCE: Save active servers to conversation metadata ---
             # This ensures resume_execution knows which servers to connect to.
             # We create a new dict to ensure SQLAlchemy detects the change on JSONB.
@@ -124,6 +130,13 @@ class ChatService:
             await self.db.commit()
             # -----------------------------------------------------------------
             
+            # Connect only to the planner's servers while the user's HITL
+            # settings load (the manager uses its own DB sessions)
+            tools, hitl_config = await asyncio.gather(
+                self._load_tools(mcp_manager, servers_to_use),
+                self._load_hitl_config(),
+            )
+            
             if not tools:
                 yield {"type": "error", "content": "No tools available."}
                 return
@@ -132,10 +145,6 @@ class ChatService:
             checkpointer = get_checkpointer()
             llm = LLMFactory.load_config_and_create_llm()
             
-            # Get user's HITL settings
-            user = await self.db.get(User, self.user_id)
-            hitl_config = user.hitl_config if user else {}
-            
             agent = Agent(llm, tools, checkpointer, hitl_config=hitl_config)
 
             yield {"type": "status", "content": "Executing..."}
@@ -151,12 +160,9 @@ class ChatService:
                 
                 if event_type == "token":
                     content = event.get("content", "")
-                    if isinstance(content, list):
-                        content = "".join([
-                            c if isinstance(c, str) else c.get("text", "") if isinstance(c, dict) else str(c)
-                            for c in content
-                        ])
-                        event["content"] = content
+                    # Plain text is the common case; only content blocks need flattening
+                    if not isinstance(content, str):
+                        content = event["content"] = _flatten_content(content)
                     final_response += content
                     yield event
                 
@@ -169,21 +175,21 @@ class ChatService:
                     yield event
                     return # Stop stream, wait for resume
                 
-                elif event_type in ["tool_start", "tool_end", "error"]:
+                elif event_type in _PASSTHROUGH_EVENT_TYPES:
                     yield event
             
             if final_response:
                 await self._save_assistant_message(conversation.id, final_response)
                 
         except Exception as e:
-            logger.error(f"Processing error: {e}", exc_info=True)
+            logger.error("Processing error: %s", e, exc_info=True)
             yield {"type": "error", "content": f"Error: {str(e)}"}
 
     async def resume_execution(
         self,
         conversation: Conversation,
         decisions: List[Dict[str, Any]],
-    ) -> AsyncGenerator[Dict[str, Any], None]:
+    ) -> AsyncGenerator[AgentEvent, None]:
         """
         Resume execution after HITL approval.
         Uses checkpointer to continue from interrupted state.
@@ -199,22 +205,14 @@ class ChatService:
             # Re-initialize context (Manager, Tools, Agent)
             mcp_manager = await mcp_pool.get_manager(self.user_id)
             
-            # Re-initialize context (Manager, Tools, Agent)
-            mcp_manager = await mcp_pool.get_manager(self.user_id)
-            
             # For resume, use persisted active servers if available
-            active_servers = (conversation.extra_metadata or {}).get("active_servers", [])
-            
-            if active_servers:
-                await mcp_manager.connect_servers(active_servers)
-                tools = await mcp_manager.get_tools(server_names=active_servers)
-            else:
-                # Fallback for legacy threads: Connect to all enabled
-                await mcp_manager._connect_all_enabled()
-                tools = await mcp_manager.get_tools()
+            metadata = conversation.extra_metadata
+            active_servers = metadata.get("active_servers") if metadata else None
             
-            user = await self.db.get(User, self.user_id)
-            hitl_config = user.hitl_config if user else {}
+            tools, hitl_config = await asyncio.gather(
+                self._load_tools(mcp_manager, active_servers),
+                self._load_hitl_config(),
+            )
             
             checkpointer = get_checkpointer()
             llm = LLMFactory.load_config_and_create_llm()
@@ -232,12 +230,9 @@ class ChatService:
 
                 if event_type == "token":
                     content = event.get("content", "")
-                    if isinstance(content, list):
-                        content = "".join([
-                            c if isinstance(c, str) else c.get("text", "") if isinstance(c, dict) else str(c)
-                            for c in content
-                        ])
-                        event["content"] = content
+                    # Plain text is the common case; only content blocks need flattening
+                    if not isinstance(content, str):
+                        content = event["content"] = _flatten_content(content)
                     final_response += content
                     yield event
                 
@@ -245,7 +240,7 @@ class ChatService:
                     yield event
                     return
                 
-                elif event_type in ["tool_start", "tool_end", "error"]:
+                elif event_type in _PASSTHROUGH_EVENT_TYPES:
                     yield event
 
             if final_response:
@@ -254,7 +249,7 @@ class ChatService:
                 await self._save_assistant_message(conversation.id, final_response)
                 
         except Exception as e:
-            logger.error(f"Resume error: {e}", exc_info=True)
+            logger.error("Resume error: %s", e, exc_info=True)
             yield {"type": "error", "content": f"Resume error: {str(e)}"}
 
     async def get_suggestions(self, query: str, limit: int = 5) -> List[str]:
@@ -301,6 +296,19 @@ class ChatService:
                 history.append(SystemMessage(content=msg.content))
         return history
     
+    async def _load_tools(self, mcp_manager: Any, server_names: Optional[List[str]]) -> List[Any]:
+        """Connect to the given servers (or all enabled ones) and return their tools."""
+        if server_names:
+            await mcp_manager.connect_servers(server_names)
+            return await mcp_manager.get_tools(server_names=server_names)
+        # Fallback for legacy threads: Connect to all enabled
+        await mcp_manager._connect_all_enabled()
+        return await mcp_manager.get_tools()
+    
+    async def _load_hitl_config(self) -> Dict[str, Any]:
+        user = await self.db.get(User, self.user_id)
+        return user.hitl_config if user else {}
+    
     async def _get_available_servers(self) -> Dict[str, Any]:
         result = await self.db.execute(
             select(MCPServerConfig).where(
@@ -333,7 +341,8 @@ class ChatService:
             # Reusing history logic
             lc_msgs = history + [("user", user_input)]
             async for chunk in llm.astream(lc_msgs):
-                 if hasattr(chunk, 'content') and chunk.content:
-                    yield {"type": "token", "content": chunk.content}
+                content = getattr(chunk, "content", None)
+                if content:
+                    yield {"type": "token", "content": content}
         except Exception as e:
             yield {"type": "error", "content": str(e)}
\ No newline at end of file
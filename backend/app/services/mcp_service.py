@@ -28,13 +28,13 @@ class MCPService:
                 if tools or attempt == max_retries:
                     return tools
                 
-                logger.info(f"Attempt {attempt + 1}: No tools found for {server_name}. Retrying in 2s...")
+                logger.info("Attempt %s: No tools found for %s. Retrying in 2s...", attempt + 1, server_name)
                 await asyncio.sleep(2)
             except Exception as e:
                 if attempt == max_retries:
-                    logger.error(f"Test connection failed for {server_name} after {max_retries} retries: {e}")
+                    logger.error("Test connection failed for %s after %s retries: %s", server_name, max_retries, e)
                     raise
-                logger.warning(f"Attempt {attempt + 1} failed for {server_name}: {e}. Retrying...")
+                logger.warning("Attempt %s failed for %s: %s. Retrying...", attempt + 1, server_name, e)
                 await asyncio.sleep(2)
         return []
 
@@ -59,7 +59,7 @@ class MCPService:
             session = client.get_session(server_name)
             
             if not session:
-                logger.error(f"Failed to get session for {server_name}")
+                logger.error("Failed to get session for %s", server_name)
                 return []
             
             # Create adapter (same pattern as MCPManager)
@@ -82,7 +82,7 @@ class MCPService:
                     elif isinstance(result, list):
                         tools_list = result
                     else:
-                        logger.warning(f"Unexpected list_tools result type for {server_name}: {type(result)}")
+                        logger.warning("Unexpected list_tools result type for %s: %s", server_name, type(result))
                         tools_list = []
                         
                     return ListToolsResult(tools_list)
@@ -112,7 +112,7 @@ class MCPService:
             return tools
             
         except Exception as e:
-            logger.error(f"Failed to get tools for {server_name}: {e}")
+            logger.error("Failed to get tools for %s: %s", server_name, e)
             raise
         finally:
             if client:
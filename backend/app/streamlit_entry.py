@@ -9,14 +9,18 @@ import asyncio
 import os
 import json
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 import requests
 import urllib.parse
 from urllib.parse import urlencode
 import uuid
 import copy
+import time
+import threading
+from collections import OrderedDict
 from langchain_core.messages import HumanMessage, AIMessage
 from backend.app.core.mcp.registry import SPHERE_REGISTRY, get_app_by_id
+from backend.app.core import jsonutil
 
 # Set page config first
 st.set_page_config(
@@ -27,36 +31,71 @@ st.set_page_config(
 )
 
 import logging
-# Silence chatty loggers
-logging.getLogger("httpx").setLevel(logging.WARNING)
-logging.getLogger("mcp_use").setLevel(logging.WARNING)
-logging.getLogger("httpcore").setLevel(logging.WARNING)
-logging.getLogger("openai").setLevel(logging.WARNING)
+import logging.config
+logger = logging.getLogger(__name__)
+
+# Chatty loggers silenced to WARNING
+QUIET_LOGGERS = ("httpx", "mcp_use", "httpcore", "openai")
+
+@st.cache_resource
+def configure_process():
+    """
+    One-time, process-wide setup. Streamlit re-executes this script on every
+    rerun, so anything global lives here instead of at module level.
+    """
+    logging.config.dictConfig({
+        "version": 1,
+        "incremental": True,
+        "loggers": {name: {"level": "WARNING"} for name in QUIET_LOGGERS},
+    })
+    
+    # Windows event loop policy fix
+    if os.name == 'nt':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+configure_process()
 
 # nest_asyncio is REQUIRED for Streamlit + PostgreSQL (asyncpg)
 try:
     import nest_asyncio
     nest_asyncio.apply()
 except ImportError:
+    nest_asyncio = None
     st.warning("⚠️ `nest_asyncio` is missing. This is required for database stability in Streamlit. Please run: `pip install nest_asyncio`")
 
-# Windows event loop policy fix
-if os.name == 'nt':
-    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-
-@st.cache_resource
-def get_loop_factory():
-    """Returns a holder for the loop to allow mutability inside cache."""
-    return {"loop": None}
-
-def get_stable_loop():
-    """Create and return a stable event loop that persists across reruns."""
-    holder = get_loop_factory()
-    if holder["loop"] is None or holder["loop"].is_closed():
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        holder["loop"] = loop
-    return holder["loop"]
+# uvloop is opt-in here: nest_asyncio cannot patch it, so nested run_async calls need the stock loop
+USE_UVLOOP = os.getenv("STREAMLIT_USE_UVLOOP", "false").lower() in ("1", "true", "yes")
+
+def _new_event_loop():
+    """Create the persistent session loop (uvloop when enabled and installed)."""
+    if USE_UVLOOP and os.name != 'nt':
+        try:
+            import uvloop
+            return uvloop.new_event_loop()
+        except ImportError:
+            pass
+    loop = asyncio.new_event_loop()
+    if nest_asyncio is not None:
+        nest_asyncio.apply(loop)
+    return loop
+
+@st.cache_resource(show_spinner=False)
+def _cached_loop():
+    """The process-wide loop; the cached LLM client and MCP sessions are bound to it."""
+    loop = _new_event_loop()
+    asyncio.set_event_loop(loop)
+    return loop
+
+def get_stable_loop(recreate: bool = False):
+    """Return the stable event loop that persists across reruns (rebuilt only if closed)."""
+    loop = _cached_loop()
+    if recreate or loop.is_closed():
+        _cached_loop.clear()
+        # Cached clients hold connection pools bound to the old loop; rebuild them too
+        get_llm.clear()
+        get_planner.clear()
+        loop = _cached_loop()
+    return loop
 
 def run_async(coro):
     """
@@ -65,18 +104,13 @@ def run_async(coro):
     """
     try:
         loop = get_stable_loop()
-        asyncio.set_event_loop(loop)
         
         # If the loop is already running, we use nest_asyncio's run_until_complete
         # but we wrap it to ensure context is handled.
         return loop.run_until_complete(coro)
     except RuntimeError as e:
         if "Event loop is closed" in str(e):
-             holder = get_loop_factory()
-             loop = asyncio.new_event_loop()
-             asyncio.set_event_loop(loop)
-             nest_asyncio.apply(loop)
-             holder["loop"] = loop
+             loop = get_stable_loop(recreate=True)
              return loop.run_until_complete(coro)
         elif "already entered" in str(e):
             # This is the 'cannot enter context' error. 
@@ -88,7 +122,7 @@ def run_async(coro):
         raise e
 
 # Project Modules
-from backend.app.core.agents.planner import Planner
+from backend.app.core.agents.planner import Planner, KNOWN_CAPABILITIES
 from backend.app.core.agents.agent import Agent
 from backend.app.core.mcp.manager import MCPManager
 from backend.app.core.llm.provider import LLMFactory
@@ -100,6 +134,114 @@ from backend.app.core.state import (
     save_history
 )
 
+@st.cache_resource
+def get_llm():
+    """Shared LLM client (and its HTTP pool), built once per process."""
+    return LLMFactory.load_config_and_create_llm()
+
+@st.cache_resource
+def get_planner():
+    """Shared Planner (stateless apart from its own LLM client), built once per process."""
+    return Planner(api_key=os.getenv("OPENROUTER_API_KEY"))
+
+# Opening-turn plans only: with no history the plan depends on just the input and servers
+PLAN_CACHE_SIZE = int(os.getenv("PLAN_CACHE_SIZE", "256"))
+PLAN_CACHE_TTL = float(os.getenv("PLAN_CACHE_TTL", "3600"))
+
+@st.cache_resource
+def _plan_cache() -> "Tuple[OrderedDict[tuple, Tuple[float, dict]], threading.Lock]":
+    """Process-wide LRU of (stored_at, plan); sessions run on separate script threads."""
+    return OrderedDict(), threading.Lock()
+
+def _plan_cache_key(user_input: str, available_servers: Dict[str, Any]) -> tuple:
+    # The planner prompt describes each server (falling back to KNOWN_CAPABILITIES), so key on the same text
+    servers = frozenset(
+        (name, info.get("description") or KNOWN_CAPABILITIES.get(name))
+        for name, info in available_servers.items()
+    )
+    return " ".join(user_input.lower().split()), servers
+
+def get_cached_plan(key: tuple) -> Optional[dict]:
+    cache, lock = _plan_cache()
+    with lock:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= PLAN_CACHE_TTL:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        plan = entry[1]
+    return copy.deepcopy(plan)
+
+def store_cached_plan(key: tuple, plan: dict):
+    entry = (time.monotonic(), copy.deepcopy(plan))
+    cache, lock = _plan_cache()
+    with lock:
+        cache[key] = entry
+        cache.move_to_end(key)
+        while len(cache) > PLAN_CACHE_SIZE:
+            cache.popitem(last=False)
+
+# Sidebar and dialogs rerun on every widget interaction; reuse the live status briefly
+TOOLS_STATUS_TTL = float(os.getenv("TOOLS_STATUS_TTL", "3"))
+
+async def get_tools_status(mcp_manager) -> Dict[str, Any]:
+    """Session-cached get_all_tools_status(), which lists tools on every connected server."""
+    cached = st.session_state.get("tools_status_cache")
+    if cached and cached[0] is mcp_manager and time.monotonic() - cached[1] < TOOLS_STATUS_TTL:
+        return cached[2]
+    status = await mcp_manager.get_all_tools_status()
+    st.session_state.tools_status_cache = (mcp_manager, time.monotonic(), status)
+    return status
+
+def invalidate_tools_status():
+    st.session_state.pop("tools_status_cache", None)
+
+def run_manager_update(coro):
+    """Run a server/tool mutation and drop the cached tools status."""
+    try:
+        return run_async(coro)
+    finally:
+        invalidate_tools_status()
+
+# Streaming render batching: re-render after N new chars or T ms, whichever comes first
+STREAM_BATCH_CHARS = int(os.getenv("STREAM_BATCH_CHARS", "24"))
+STREAM_BATCH_MS = int(os.getenv("STREAM_BATCH_MS", "50"))
+
+class StreamBuffer:
+    """Accumulates streamed text and pushes it to a container in batches."""
+
+    def __init__(self, container):
+        self.container = container
+        self.text = ""
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def append(self, chunk: str):
+        self.text += chunk
+        self._pending += len(chunk)
+        if (self._pending >= STREAM_BATCH_CHARS
+                or (time.monotonic() - self._last_flush) * 1000 >= STREAM_BATCH_MS):
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            self.container.markdown(self.text)
+            self._pending = 0
+        self._last_flush = time.monotonic()
+
+class TurnTimer:
+    """Millisecond marks since the user submitted a turn (TTFT and friends)."""
+
+    def __init__(self):
+        self._t0 = time.perf_counter()
+        self.marks: Dict[str, float] = {}
+
+    def mark(self, name: str, overwrite: bool = False):
+        if overwrite or name not in self.marks:
+            self.marks[name] = round((time.perf_counter() - self._t0) * 1000, 1)
+
 def load_custom_css():
     st.markdown("""
     <style>
@@ -118,38 +260,48 @@ def load_custom_css():
     </style>
     """, unsafe_allow_html=True)
 
+# Fresh-session defaults; containers are copied per session so none are shared
+_SESSION_DEFAULTS: Dict[str, Any] = {
+    "user": None,
+    "initialized": False,
+    "messages": [],
+    "history": [],
+    "events": [],
+    "thread_id": None,
+    "loop": None,
+    "agent": None,
+    "mcp_manager": None,
+    "is_processing": False,
+    "tenant_id": None,
+    "user_id": None,
+    "pending_approval": None,
+    "selected_app": None,
+}
+
 def init_session_state():
     if "initialized" not in st.session_state:
-        st.session_state.user = None
-        st.session_state.initialized = False
-        st.session_state.messages = []
-        st.session_state.history = []
-        st.session_state.events = []
-        st.session_state.thread_id = None
-        st.session_state.planner = None
-        st.session_state.agent = None
-        st.session_state.mcp_manager = None
-        st.session_state.is_processing = False
-        st.session_state.tenant_id = None
-        st.session_state.user_id = None
-        st.session_state.pending_approval = None
-        st.session_state.selected_app = None
+        for key, value in _SESSION_DEFAULTS.items():
+            st.session_state[key] = copy.copy(value)
 
 async def initialize_app(user_id: Any):
     # Instantiate Manager with user_id
     manager = MCPManager(user_id=user_id)
-    await manager.initialize()
     
     # We load LLM and Planner once
-    llm = LLMFactory.load_config_and_create_llm()
-    planner = Planner(api_key=os.getenv("OPENROUTER_API_KEY"))
+    llm = get_llm()
+    planner = get_planner()
     
     # Use valid UUIDs for database compatibility
     # Tenant ID could also be user-specific, for now we use a default tenant
     tenant_id = os.getenv("DEFAULT_TENANT_ID", "00000000-0000-0000-0000-000000000001")
     
     thread_id, is_new = get_or_create_session(tenant_id)
-    history = await load_history(thread_id, tenant_id, user_id)
+    
+    # MCP discovery and the history query are independent round-trips
+    _, history = await asyncio.gather(
+        manager.initialize(),
+        load_history(thread_id, tenant_id, user_id),
+    )
     
     return planner, manager, thread_id, history, is_new, tenant_id, user_id
 
@@ -189,11 +341,12 @@ def render_login_page():
 async def process_message_async(user_input: str, planner, mcp_manager, history, thread_id, tenant_id, user_id):
     events = []
     full_response = ""
+    timer = TurnTimer()
     
     try:
         # 1. PLANNING PHASE (with streaming support for direct response)
         # Fetch status but filtering for Planner: Only show ENABLED servers
-        full_status = await mcp_manager.get_all_tools_status()
+        full_status = await get_tools_status(mcp_manager)
         available_servers = {
             k: v for k, v in full_status.items() 
             if v.get("enabled", True)
@@ -201,62 +354,83 @@ async def process_message_async(user_input: str, planner, mcp_manager, history,
         
         # Main message container
         message_container = st.empty()
-        full_direct_response = ""
+        direct_stream = StreamBuffer(message_container)
         plan = None
         
+        # Opening turns skip the planner LLM call when the same input was planned before
+        plan_key = _plan_cache_key(user_input, available_servers) if not history else None
+        plan = get_cached_plan(plan_key) if plan_key else None
+        
         # Planning visualization
-        with st.status("🧠 Thinking...", expanded=True) as plan_status:
-            async for chunk in planner.plan(user_input, history, available_servers):
-                if isinstance(chunk, str):
-                    full_direct_response += chunk
-                    message_container.markdown(full_direct_response)
-                else:
-                    plan = chunk
-            plan_status.update(label="🧠 Thought process complete", state="complete", expanded=False)
+        if plan is not None:
+            full_direct_response = "" if plan.get("servers") else (plan.get("response") or "")
+            if full_direct_response:
+                message_container.markdown(full_direct_response)
+        else:
+            with st.status("🧠 Thinking...", expanded=True) as plan_status:
+                async for chunk in planner.plan(user_input, history, available_servers):
+                    if isinstance(chunk, str):
+                        timer.mark("planner_first_token_ms")
+                        timer.mark("last_token_ms", overwrite=True)
+                        direct_stream.append(chunk)
+                    else:
+                        plan = chunk
+                direct_stream.flush()
+                full_direct_response = direct_stream.text
+                plan_status.update(label="🧠 Thought process complete", state="complete", expanded=False)
+            if plan_key and plan is not None and not plan.get("error"):
+                store_cached_plan(plan_key, plan)
         
         # 2. EXECUTION PHASE
         if plan.get("servers"):
             with st.spinner("🔌 Initiating Agents..."):
                 await mcp_manager.connect_to_servers(plan['servers'])
+                invalidate_tools_status()
                 if mcp_manager._mcp_client:
                     mcp_manager._mcp_client.allowed_servers = list(plan['servers'])
             
             # EXECUTION: Refresh agent every turn
-            llm = LLMFactory.load_config_and_create_llm()
+            llm = get_llm()
             # Get wrapped tools (with HITL guards)
             tools = await mcp_manager.get_tools_for_servers(plan['servers'])
             agent = Agent(llm=llm, mcp_client=mcp_manager._mcp_client, tools=tools)
             
             history.append(HumanMessage(content=user_input))
             
-            full_agent_response = ""
+            agent_stream = StreamBuffer(message_container)
             
-            # Status container for tool tracking
+            # Status container for tool tracking: one append-only log instead of widgets per call
             status = st.status("🤖 Agent is working...", expanded=True)
+            with status:
+                tool_log_view = st.empty()
+            tool_log = []
             
-            async for event in agent.execute_streaming(user_input, history[:-1]):
+            async for event in agent.execute_streaming(user_input, history[:-1], thread_id=thread_id):
                 etype = event.get("type")
                 
                 if etype == "token":
-                    full_agent_response += event["content"]
-                    message_container.markdown(full_agent_response)
+                    timer.mark("agent_first_token_ms")
+                    timer.mark("last_token_ms", overwrite=True)
+                    agent_stream.append(event["content"])
                 
                 elif etype == "tool_start":
                     t_name = event.get("tool")
                     status.update(label=f"🛠️ Tool: `{t_name}`")
-                    with status:
-                        with st.expander(f"Parameters: `{t_name}`", expanded=False):
-                            st.json(event.get("inputs", {}))
+                    tool_log.append({"tool": t_name, "inputs": event.get("inputs", {})})
                 
                 elif etype == "tool_end":
                     t_name = event.get("tool")
                     status.update(label=f"✅ `{t_name}` finished.")
-                    with status:
-                        with st.expander(f"Result: `{t_name}`", expanded=False):
-                            st.markdown(event.get("output", "Done"))
+                    entry = next((e for e in reversed(tool_log) if e["tool"] == t_name and "output" not in e), None)
+                    if entry is None:
+                        entry = {"tool": t_name}
+                        tool_log.append(entry)
+                    entry["output"] = event.get("output", "Done")
+                    tool_log_view.code(jsonutil.pretty(tool_log), language="json")
                 
                 elif etype == "approval_required":
                     # Store in session state and STOP this turn
+                    agent_stream.flush()
                     st.session_state.pending_approval = {
                         "tool_name": event["tool_name"],
                         "tool_args": event["tool_args"],
@@ -269,11 +443,12 @@ async def process_message_async(user_input: str, planner, mcp_manager, history,
                 
                 elif etype == "error":
                     st.error(event.get("message"))
-                    full_agent_response += f"\n\n❌ {event.get('message')}"
+                    agent_stream.append(f"\n\n❌ {event.get('message')}")
             
+            agent_stream.flush()
             status.update(label="✨ Task Complete", state="complete", expanded=False)
             
-            full_response = full_agent_response
+            full_response = agent_stream.text
             history.append(AIMessage(content=full_response))
         else:
             full_response = plan.get("response", full_direct_response) or "I can help with that."
@@ -289,6 +464,9 @@ async def process_message_async(user_input: str, planner, mcp_manager, history,
         events.append({"type": "error", "content": str(e), "ts": datetime.now().strftime("%H:%M:%S")})
         full_response = f"Error: {e}"
         st.error(full_response)
+    
+    events.append({"type": "ttft", **timer.marks, "ts": datetime.now().strftime("%H:%M:%S")})
+    logger.info("⏱️ Turn timings: %s", timer.marks)
         
     return full_response, history, events
 
@@ -365,6 +543,7 @@ async def handle_oauth_callback():
             server_name = "google-drive"
             if st.session_state.mcp_manager:
                 success = await st.session_state.mcp_manager.add_server(server_name, config)
+                invalidate_tools_status()
                 if success:
                     st.success("✅ Google Drive Connected Successfully!")
                     st.query_params.clear()
@@ -380,7 +559,7 @@ def render_sphere_app_center():
         return
 
     # Get current status to see what's connected
-    status = run_async(st.session_state.mcp_manager.get_all_tools_status())
+    status = run_async(get_tools_status(st.session_state.mcp_manager))
     connected_names = set(status.keys())
     
     # 1. Connection Dialog (If an app is chosen for auth)
@@ -415,7 +594,7 @@ def render_sphere_app_center():
                         
                         # Try to connect with validation
                         with st.spinner(f"Verifying connection to {app.name}..."):
-                                success = run_async(st.session_state.mcp_manager.add_server(app.id, config, validate=True))
+                                success = run_manager_update(st.session_state.mcp_manager.add_server(app.id, config, validate=True))
                                 if success:
                                     st.success(f"✅ Successfully connected to {app.name}!")
                                     st.session_state.selected_app = None
@@ -450,7 +629,7 @@ def render_sphere_app_center():
                 """, unsafe_allow_html=True)
                 # Small button to disconnect if they want
                 if st.button("Disconnect", key=f"disco_{app.id}", use_container_width=True):
-                    run_async(st.session_state.mcp_manager.remove_server(app.id))
+                    run_manager_update(st.session_state.mcp_manager.remove_server(app.id))
                     st.rerun()
             idx += 1
             
@@ -489,7 +668,7 @@ def render_sphere_app_center():
                 if st.button(f"Configure {app.name}", key=f"conn_btn_{app.id}", use_container_width=True):
                     if not app.auth_fields:
                         # No auth needed, connect immediately
-                        run_async(st.session_state.mcp_manager.add_server(app.id, app.config_template, validate=True))
+                        run_manager_update(st.session_state.mcp_manager.add_server(app.id, app.config_template, validate=True))
                         st.rerun()
                     else:
                         st.session_state.selected_app = app.id
@@ -531,7 +710,7 @@ def render_server_manager_dialog():
                     "sensitive_tools": [s.strip() for s in sensitive_tools_str.split("\n") if s.strip()],
                     "approval_message": msg
                 }
-                success = run_async(st.session_state.mcp_manager.update_user_hitl_config(new_config))
+                success = run_manager_update(st.session_state.mcp_manager.update_user_hitl_config(new_config))
                 if success:
                     st.success("✅ HITL Settings Updated!")
                     st.rerun()
@@ -573,7 +752,7 @@ def render_server_manager_dialog():
                         "url": url,
                         "transport": "sse"
                     }
-                    run_async(st.session_state.mcp_manager.add_server(server_name, config))
+                    run_manager_update(st.session_state.mcp_manager.add_server(server_name, config))
                     st.success(f"Added {server_name}")
                     st.rerun()
                     
@@ -590,7 +769,7 @@ def render_server_manager_dialog():
                         "args": ["-y", pkg] + args_str.split(),
                         "env": env_dict
                     }
-                    run_async(st.session_state.mcp_manager.add_server(server_name, config))
+                    run_manager_update(st.session_state.mcp_manager.add_server(server_name, config))
                     st.success(f"Added {server_name}")
                     st.rerun()
                 except Exception as e:
@@ -609,7 +788,7 @@ def render_server_manager_dialog():
                         "args": args_str.split(),
                         "env": env_dict
                     }
-                    run_async(st.session_state.mcp_manager.add_server(server_name, config))
+                    run_manager_update(st.session_state.mcp_manager.add_server(server_name, config))
                     st.success(f"Added {server_name}")
                     st.rerun()
                 except Exception as e:
@@ -617,7 +796,7 @@ def render_server_manager_dialog():
 
     with tab2:
         if st.session_state.mcp_manager:
-            status = run_async(st.session_state.mcp_manager.get_all_tools_status())
+            status = run_async(get_tools_status(st.session_state.mcp_manager))
             
             for s_name, s_info in status.items():
                 is_enabled = s_info.get("enabled", True)
@@ -645,14 +824,14 @@ def render_server_manager_dialog():
                     def on_server_toggle(s_n=s_name):
                         # Get new state from session state
                         new_state = st.session_state.get(f"server_toggle_{s_n}")
-                        run_async(st.session_state.mcp_manager.toggle_server_status(s_n, new_state))
+                        run_manager_update(st.session_state.mcp_manager.toggle_server_status(s_n, new_state))
 
                     st.toggle("Enable", value=is_enabled, key=f"server_toggle_{s_name}", 
                              label_visibility="collapsed", on_change=on_server_toggle)
 
                 with col_del:
                     def on_delete_server(s_n=s_name):
-                        run_async(st.session_state.mcp_manager.remove_server(s_n))
+                        run_manager_update(st.session_state.mcp_manager.remove_server(s_n))
                         
                     st.button("🗑️", key=f"del_{s_name}", on_click=on_delete_server)
                 
@@ -661,7 +840,7 @@ def render_server_manager_dialog():
                      # Inspect button if not connected standardly
                      if not is_connected and is_enabled:
                          def on_inspect(s_n=s_name):
-                             run_async(st.session_state.mcp_manager.inspect_server_tools(s_n))
+                             run_manager_update(st.session_state.mcp_manager.inspect_server_tools(s_n))
 
                          st.button(f"Inspect Tools for {s_name}", key=f"inspect_{s_name}", on_click=on_inspect)
                      
@@ -677,7 +856,7 @@ def render_server_manager_dialog():
                              def on_tool_toggle(t_n=t_name, s_n=s_name):
                                  # Current checkbox value
                                  new_val = st.session_state.get(f"tool_cb_{s_n}_{t_n}")
-                                 run_async(st.session_state.mcp_manager.toggle_tool_status(t_n, new_val))
+                                 run_manager_update(st.session_state.mcp_manager.toggle_tool_status(t_n, new_val))
 
                              with tool_cols[i % 3]:
                                  st.checkbox(t_name, value=is_tool_enabled, 
@@ -712,7 +891,7 @@ def render_sidebar():
         st.markdown("---")
         st.markdown("### 🔌 Servers")
         if st.session_state.mcp_manager:
-            status = run_async(st.session_state.mcp_manager.get_all_tools_status())
+            status = run_async(get_tools_status(st.session_state.mcp_manager))
             for s_name, s_info in status.items():
                 icon = "🟢" if s_info['connected'] else "🔴"
                 st.write(f"{icon} {s_name} ({s_info['tools_count']} tools)")
@@ -734,7 +913,7 @@ def render_main_chat():
         with st.chat_message("assistant"):
             resp, hist, evs = run_async(process_message_async(
                 prompt, 
-                st.session_state.planner,
+                get_planner(),
                 st.session_state.mcp_manager,
                 st.session_state.history,
                 st.session_state.thread_id,
@@ -750,7 +929,7 @@ def render_main_chat():
         with st.chat_message("assistant"):
             pa = st.session_state.pending_approval
             st.warning(f"🛠️ **Approval Required**: `{pa['tool_name']}`")
-            st.json(pa['tool_args'])
+            st.code(jsonutil.pretty(pa['tool_args']), language="json")
             
             col1, col2 = st.columns(2)
             with col1:
@@ -770,7 +949,7 @@ def render_main_chat():
                     with st.status("🚀 Resuming...", expanded=True) as status:
                         resp, hist, evs = run_async(process_message_async(
                             u_input, 
-                            st.session_state.planner,
+                            get_planner(),
                             st.session_state.mcp_manager,
                             st.session_state.history,
                             st.session_state.thread_id,
@@ -790,6 +969,9 @@ def render_main_chat():
                     st.session_state.history.append(AIMessage(content="User rejected the tool execution."))
                     st.rerun()
 
+# LangChain message type -> chat bubble role (anything else renders as the assistant)
+_CHAT_ROLE_BY_MESSAGE_TYPE = {"human": "user"}
+
 def main():
     init_session_state()
     load_custom_css()
@@ -799,17 +981,22 @@ def main():
         render_login_page()
         return
 
+    # A rebuilt event loop orphans this session's MCP sessions; re-initialize on the new one
+    if st.session_state.initialized and st.session_state.loop is not get_stable_loop():
+        st.session_state.initialized = False
+
     if not st.session_state.initialized:
         with st.spinner("Initializing..."):
             # Initialize with logged in user
-            p, m, tid, hist, is_new, tenant_id, user_id = run_async(initialize_app(st.session_state.user.id))
-            st.session_state.planner = p
+            _, m, tid, hist, is_new, tenant_id, user_id = run_async(initialize_app(st.session_state.user.id))
+            st.session_state.loop = get_stable_loop()
             st.session_state.mcp_manager = m
             st.session_state.thread_id = tid
             st.session_state.history = hist
             st.session_state.tenant_id = tenant_id
             st.session_state.user_id = user_id
-            st.session_state.messages = [{"role": "user" if msg.type == "human" else "assistant", "content": msg.content} for msg in hist]
+            role_of = _CHAT_ROLE_BY_MESSAGE_TYPE.get
+            st.session_state.messages = [{"role": role_of(msg.type, "assistant"), "content": msg.content} for msg in hist]
             st.session_state.initialized = True
             st.rerun()
 